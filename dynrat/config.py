@@ -2,6 +2,11 @@ import os
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 class Config:
 
@@ -16,13 +21,20 @@ class Config:
     def _load_config(self):
 
         with open(self._config_path, 'r') as stream:
-            config = yaml.load(stream, yaml.Loader)
+            config = yaml.load(stream, _Loader)
 
         self._config = config
+        self._mtime = os.path.getmtime(self._config_path)
+
+    def _maybe_reload(self):
+
+        mtime = os.path.getmtime(self._config_path)
+        if mtime != self._mtime:
+            self._load_config()
 
     def __getitem__(self, key):
 
-        self._load_config()
+        self._maybe_reload()
 
         if key in self._config.keys():
             return self._config[key]
@@ -9,19 +9,215 @@ References
 
 """
 
-# import logging
+import logging
+from math import isfinite, sqrt
 
 import numpy as np
-from scipy.optimize import newton
 
 import dynrat
 from dynrat import GRAVITY
 
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    prange = range
+    _HAVE_NUMBA = False
+
 
 # module-level logger
 logger = dynrat.logger.getChild(__name__)
 
 
+def _make_newton():
+    """Builds the Newton kernel used by :meth:`QSolver.q_solve`.
+
+    The kernel fuses the zero function and its derivative, which
+    share the polynomial term ``l0``, into a single closed loop.
+    When Numba is available, the kernel is compiled in nopython
+    mode and cached on disk.
+
+    """
+
+    def newton_q(q0, l2, l3, l4, l5, l6, tol, maxiter):
+
+        q = q0
+
+        for i in range(maxiter):
+
+            l0 = l3 + l4 / q + l5 * q + l6 * q * q
+
+            if l0 <= 0:
+                return np.nan, i + 1
+
+            sqrt_l0 = sqrt(l0)
+
+            f = q - l2 * sqrt_l0
+
+            l1 = -l4 / (q * q) + l5 + 2 * l6 * q
+            f_prime = 1 - 0.5 * l2 * l1 / sqrt_l0
+
+            if f_prime == 0:
+                return np.nan, i + 1
+
+            step = f / f_prime
+            q = q - step
+
+            if abs(step) < tol:
+                return q, i + 1
+
+        return np.nan, maxiter
+
+    if _HAVE_NUMBA:
+        newton_q = njit(cache=True, nogil=True,
+                        error_model='numpy')(newton_q)
+
+    return newton_q
+
+
+_newton_q = _make_newton()
+
+
+def _make_compute_q_series():
+    """Builds the batch kernel used by :meth:`QSolver.compute_q_series`.
+
+    The kernel works on the raw stage/property breakpoint arrays of a
+    table-backed cross section and friction table, so that the whole
+    per-step computation, including the Newton iteration, runs without
+    touching Python objects. When Numba is available, the kernel is
+    compiled in nopython mode with a parallel loop over time steps and
+    cached on disk.
+
+    """
+
+    def compute_q_series(h, h_prime, q_prime, stage, area_tbl,
+                         top_width_tbl, wp_tbl, frict_stage, frict_n,
+                         l3_const, bed_over_sr2, inv_dt, inv_g_dt,
+                         tol, maxiter):
+
+        n_steps = h.shape[0]
+        q = np.empty(n_steps)
+
+        for i in prange(n_steps):
+
+            h_i = h[i]
+            h_p = h_prime[i]
+
+            area = np.interp(h_i, stage, area_tbl)
+            top_width = np.interp(h_i, stage, top_width_tbl)
+            wetted_perimeter = np.interp(h_i, stage, wp_tbl)
+            area_prime = np.interp(h_p, stage, area_tbl)
+            n = np.interp(h_i, frict_stage, frict_n)
+
+            dh = h_i - h_p
+            dhs = dh * inv_dt
+
+            dh_safe = dh if dh != 0.0 else 1e-9
+            wp_prime = np.interp(h_p, stage, wp_tbl)
+            k = 5 / 3 - 2 / 3 * \
+                (area / (top_width * wetted_perimeter)) * \
+                ((wetted_perimeter - wp_prime) / dh_safe)
+
+            hydraulic_depth = area / top_width
+
+            l2 = 1.486 * area * \
+                (hydraulic_depth * hydraulic_depth)**(1 / 3) / n
+            l3 = l3_const + q_prime[i] * inv_g_dt / area_prime
+            l4 = area * dhs / k
+            l5 = (1 - 1 / k) * top_width * dhs / (GRAVITY * area * area) \
+                - inv_g_dt / area
+            l6 = -2 / 3 * (bed_over_sr2 * top_width) \
+                / (GRAVITY * area * area * area)
+
+            root, _ = _newton_q(q_prime[i], l2, l3, l4, l5, l6,
+                                tol, maxiter)
+            q[i] = root
+
+        return q
+
+    if _HAVE_NUMBA:
+        compute_q_series = njit(cache=True, parallel=True, nogil=True,
+                                error_model='numpy')(compute_q_series)
+
+    return compute_q_series
+
+
+_compute_q_series = _make_compute_q_series()
+
+
+def _make_q_solve_recurrence():
+    """Builds the recurrence kernel used by
+    :meth:`QSolver.q_solve_recurrence`.
+
+    Unlike the batch kernel, each step uses the previous computed
+    discharge, so the loop is sequential. When Numba is available,
+    the kernel is compiled in nopython mode and cached on disk.
+
+    """
+
+    def q_solve_recurrence(h, h0, q0, stage, area_tbl, top_width_tbl,
+                           wp_tbl, frict_stage, frict_n, l3_const,
+                           bed_over_sr2, inv_dt, inv_g_dt, tol, maxiter):
+
+        n_steps = h.shape[0]
+        q = np.empty(n_steps)
+
+        h_p = h0
+        q_p = q0
+
+        for i in range(n_steps):
+
+            h_i = h[i]
+
+            area = np.interp(h_i, stage, area_tbl)
+            top_width = np.interp(h_i, stage, top_width_tbl)
+            wetted_perimeter = np.interp(h_i, stage, wp_tbl)
+            area_prime = np.interp(h_p, stage, area_tbl)
+            n = np.interp(h_i, frict_stage, frict_n)
+
+            dh = h_i - h_p
+            dhs = dh * inv_dt
+
+            dh_safe = dh if dh != 0.0 else 1e-9
+            wp_prime = np.interp(h_p, stage, wp_tbl)
+            k = 5 / 3 - 2 / 3 * \
+                (area / (top_width * wetted_perimeter)) * \
+                ((wetted_perimeter - wp_prime) / dh_safe)
+
+            hydraulic_depth = area / top_width
+
+            l2 = 1.486 * area * \
+                (hydraulic_depth * hydraulic_depth)**(1 / 3) / n
+            l3 = l3_const + q_p * inv_g_dt / area_prime
+            l4 = area * dhs / k
+            l5 = (1 - 1 / k) * top_width * dhs / (GRAVITY * area * area) \
+                - inv_g_dt / area
+            l6 = -2 / 3 * (bed_over_sr2 * top_width) \
+                / (GRAVITY * area * area * area)
+
+            root, _ = _newton_q(q_p, l2, l3, l4, l5, l6, tol, maxiter)
+            q[i] = root
+
+            if not isfinite(root):
+                for j in range(i + 1, n_steps):
+                    q[j] = np.nan
+                return q
+
+            h_p = h_i
+            q_p = root
+
+        return q
+
+    if _HAVE_NUMBA:
+        q_solve_recurrence = njit(cache=True, nogil=True,
+                                  error_model='numpy')(q_solve_recurrence)
+
+    return q_solve_recurrence
+
+
+_q_solve_recurrence = _make_q_solve_recurrence()
+
+
 class QSolver:
     """Iterative solver for discharge using stage time series.
 
@@ -48,10 +244,18 @@ class QSolver:
         self._slope_ratio = slope_ratio
         self._time_step = time_step
 
+        # quantities that depend only on constructor parameters,
+        # computed once instead of on every time step
+        self._slope_ratio_sq = slope_ratio**2
+        self._bed_over_sr2 = bed_slope / self._slope_ratio_sq
+        self._l3_const = bed_slope + 2 / 3 * self._bed_over_sr2
+        self._inv_dt = 1.0 / time_step
+        self._inv_g_dt = 1.0 / (GRAVITY * time_step)
+
         self.logger = logger.getChild(self.__class__.__name__)
 
     def _dhs(self, h, h_prime):
-        return (h - h_prime) / self._time_step
+        return (h - h_prime) * self._inv_dt
 
     def _f(self, q, l2, l3, l4, l5, l6):
         """Zero function.
@@ -61,22 +265,9 @@ class QSolver:
         not need to be computed for every iteration.
         """
 
-        l0 = self._L0(q, l3, l4, l5, l6)
-
-        f = q - l2 * l0**(1 / 2)
-
-        self.logger.debug("f computed {}".format(f))
-
-        if not np.isfinite(f):
-            self.logger.error(
-                "f computed a non-finite value")
-            raise RuntimeError("Non-finite value computed")
-
-        if np.iscomplex(f):
-            self.logger.error("f computed a complex value")
-            raise RuntimeError("Complex value computed")
+        l0 = l3 + l4 / q + l5 * q + l6 * q * q
 
-        return f
+        return q - l2 * np.sqrt(l0)
 
     def _f_prime(self, q, l2, l3, l4, l5, l6):
         """Derivative (with respect to q) of the zero function.
@@ -86,37 +277,26 @@ class QSolver:
         not need to be computed for every iteration.
         """
 
-        l0 = self._L0(q, l3, l4, l5, l6)
-        l1 = self._L1(q, l4, l5, l6)
-
-        f_prime = 1 - 0.5 * l2 * l1 / l0**(1 / 2)
-
-        self.logger.debug("f_prime computed {}".format(f_prime))
-
-        if not np.isfinite(f_prime):
-            self.logger.error(
-                "f_prime computed a non-finite value")
-            raise RuntimeError("Non-finite value computed")
-
-        if np.iscomplex(f_prime):
-            self.logger.error("f_prime computed a complex value")
-            raise RuntimeError("Complex value computed")
+        l0 = l3 + l4 / q + l5 * q + l6 * q * q
+        l1 = -l4 / (q * q) + l5 + 2 * l6 * q
 
-        return f_prime
+        return 1 - 0.5 * l2 * l1 / np.sqrt(l0)
 
     def _K(self, h, h_prime):
 
+        # when dh is zero the wetted perimeter difference is also
+        # zero, so an epsilon denominator yields K = 5/3 exactly
+        # without branching on the stage difference
         dh = h - h_prime
+        if dh == 0.0:
+            dh = 1e-9
 
-        if dh == 0:
-            k = 5/3
-        else:
-            top_width = self._sect.top_width(h)
-            wetted_perimeter = self._sect.wetted_perimeter(h)
-            wetted_perimeter_prime = self._sect.wetted_perimeter(h_prime)
-            area = self._sect.area(h)
-            dPdh = (wetted_perimeter - wetted_perimeter_prime)/dh
-            k = 5 / 3 - 2 / 3 * (area / (top_width * wetted_perimeter)) * dPdh
+        top_width = self._sect.top_width(h)
+        wetted_perimeter = self._sect.wetted_perimeter(h)
+        wetted_perimeter_prime = self._sect.wetted_perimeter(h_prime)
+        area = self._sect.area(h)
+        dPdh = (wetted_perimeter - wetted_perimeter_prime)/dh
+        k = 5 / 3 - 2 / 3 * (area / (top_width * wetted_perimeter)) * dPdh
 
         if k < 0:
             self.logger.warning("K = {} < 0".format(k))
@@ -126,12 +306,12 @@ class QSolver:
     @staticmethod
     def _L0(q, l3, l4, l5, l6):
 
-        return l3 + l4 / q + l5 * q + l6 * q**2
+        return l3 + l4 / q + l5 * q + l6 * q * q
 
     @staticmethod
     def _L1(q, l4, l5, l6):
 
-        return -l4 / q**2 + l5 + 2 * l6 * q
+        return -l4 / (q * q) + l5 + 2 * l6 * q
 
     def _L2(self, h):
 
@@ -141,15 +321,14 @@ class QSolver:
 
         hydraulic_depth = area / top_width
 
-        return 1.486 * area * hydraulic_depth**(2 / 3) / n
+        return 1.486 * area * \
+            np.cbrt(hydraulic_depth * hydraulic_depth) / n
 
     def _L3(self, q_prime, h_prime):
 
         area_prime = self._sect.area(h_prime)
 
-        return self._bed_slope + \
-            2 / 3 * self._bed_slope / self._slope_ratio**2 \
-            + q_prime / (GRAVITY * area_prime * self._time_step)
+        return self._l3_const + q_prime * self._inv_g_dt / area_prime
 
     def _L4(self, h, h_prime):
 
@@ -168,7 +347,7 @@ class QSolver:
         area = self._sect.area(h)
         dhs = self._dhs(h, h_prime)
 
-        l5 = (1 - 1 / k) * top_width * dhs / (GRAVITY * area**2) \
+        l5 = (1 - 1 / k) * top_width * dhs / (GRAVITY * area * area) \
             - 1 / (GRAVITY * area * self._time_step)
 
         return l5
@@ -178,8 +357,357 @@ class QSolver:
         top_width = self._sect.top_width(h)
         area = self._sect.area(h)
 
-        return -2 / 3 * (self._bed_slope * top_width) \
-            / (self._slope_ratio**2 * GRAVITY * area**3)
+        return -2 / 3 * (self._bed_over_sr2 * top_width) \
+            / (GRAVITY * area * area * area)
+
+    def _l_coefficients(self, h, h_prime, q_prime):
+        """Computes the coefficients of the zero function.
+
+        Queries each cross section property exactly once and
+        computes `K` and `l2` through `l6` inline from the shared
+        values. Equivalent to calling `_L2` through `_L6`
+        individually, without the redundant section lookups.
+        """
+
+        # sections with a fused property lookup answer each stage in
+        # one bracket computation instead of one per property
+        properties = getattr(self._sect, 'properties', None)
+
+        if properties is not None and not np.ndim(h):
+            props = properties(h)
+            props_prime = properties(h_prime)
+            area = props.area
+            top_width = props.top_width
+            wetted_perimeter = props.wetted_perimeter
+            area_prime = props_prime.area
+            wetted_perimeter_prime = props_prime.wetted_perimeter
+        else:
+            area = self._sect.area(h)
+            top_width = self._sect.top_width(h)
+            wetted_perimeter = self._sect.wetted_perimeter(h)
+            area_prime = self._sect.area(h_prime)
+            wetted_perimeter_prime = self._sect.wetted_perimeter(h_prime)
+
+        n = self._frict.roughness(h)
+
+        dh = h - h_prime
+        dhs = dh * self._inv_dt
+
+        if np.ndim(dh):
+            dh_safe = np.where(dh == 0, 1e-9, dh)
+        else:
+            dh_safe = dh if dh != 0.0 else 1e-9
+        dPdh = (wetted_perimeter - wetted_perimeter_prime) / dh_safe
+        k = 5 / 3 - 2 / 3 * (area / (top_width * wetted_perimeter)) * dPdh
+
+        if np.any(k < 0):
+            self.logger.warning("K = {} < 0".format(k))
+
+        hydraulic_depth = area / top_width
+
+        l2 = 1.486 * area * \
+            np.cbrt(hydraulic_depth * hydraulic_depth) / n
+        l3 = self._l3_const + q_prime * self._inv_g_dt / area_prime
+        l4 = area * dhs / k
+        l5 = (1 - 1 / k) * top_width * dhs / (GRAVITY * area * area) \
+            - self._inv_g_dt / area
+        l6 = -2 / 3 * (self._bed_over_sr2 * top_width) \
+            / (GRAVITY * area * area * area)
+
+        return l2, l3, l4, l5, l6
+
+    def compute_q_series(self, h, h_prime, q_prime):
+        """Solves for discharge over a series of stage values using
+        the batch kernel
+
+        Like :meth:`q_solve_series`, but runs entirely on the
+        stage/property breakpoint arrays of a table-backed cross
+        section (:class:`.TableSect` or :class:`.CrossSect`) and a
+        :class:`.TableFrict`, so the whole series is computed in one
+        compiled (or single Python) call without per-step section
+        lookups.
+
+        Parameters
+        ----------
+        h : array_like
+            Stage of current time steps
+        h_prime : array_like
+            Stage of previous time steps
+        q_prime : array_like
+            Discharge of previous time steps. Also used as the
+            initial estimates of q.
+
+        Returns
+        -------
+        numpy.ndarray
+            Computed discharge. Elements that failed to converge are
+            NaN.
+
+        """
+
+        h = np.ascontiguousarray(h, dtype=np.float64)
+        h_prime = np.ascontiguousarray(h_prime, dtype=np.float64)
+        q_prime = np.ascontiguousarray(q_prime, dtype=np.float64)
+
+        tables = self._table_arrays()
+
+        # convergence tolerance
+        tol = 1.0  # cfs
+
+        q = _compute_q_series(
+            h, h_prime, q_prime, *tables,
+            self._l3_const, self._bed_over_sr2, self._inv_dt,
+            self._inv_g_dt, tol, 50)
+
+        nan_count = np.count_nonzero(np.isnan(q))
+        if nan_count:
+            self.logger.error(
+                "dynmod solver failed to converge for "
+                + "{} of {} time steps".format(nan_count, q.size))
+
+        return q
+
+    def _table_arrays(self):
+        """Returns the breakpoint arrays of a table-backed cross
+        section and friction as contiguous float64 arrays.
+
+        Raises a RuntimeError when the cross section or the friction
+        does not expose breakpoint arrays.
+        """
+
+        # CrossSect wraps a TableSect in its _sect attribute
+        table = getattr(self._sect, '_sect', self._sect)
+
+        try:
+            stage = table._stage
+            area = table._area
+            top_width = table._top_width
+            wetted_perimeter = table._wetted_perimeter
+            frict_stage = self._frict._stage
+            frict_n = self._frict._roughness
+        except AttributeError:
+            raise RuntimeError(
+                "Cross section and friction must be table-backed to "
+                + "solve on breakpoint arrays")
+
+        return (np.ascontiguousarray(stage, dtype=np.float64),
+                np.ascontiguousarray(area, dtype=np.float64),
+                np.ascontiguousarray(top_width, dtype=np.float64),
+                np.ascontiguousarray(wetted_perimeter, dtype=np.float64),
+                np.ascontiguousarray(frict_stage, dtype=np.float64),
+                np.ascontiguousarray(frict_n, dtype=np.float64))
+
+    def q_solve_recurrence(self, h, h0, q0):
+        """Solves the discharge recurrence over a stage series
+
+        Computes the whole series in one compiled (or single Python)
+        call, feeding each step's computed discharge into the next,
+        exactly as a per-step :meth:`q_solve` loop would. Requires a
+        table-backed cross section (:class:`.TableSect` or
+        :class:`.CrossSect`) and a :class:`.TableFrict`.
+
+        Parameters
+        ----------
+        h : array_like
+            Stage series
+        h0 : float
+            Stage of the time step before `h[0]`
+        q0 : float
+            Discharge of the time step before `h[0]`
+
+        Returns
+        -------
+        numpy.ndarray
+            Computed discharge. If a step fails to converge, that
+            element and all following elements are NaN.
+
+        """
+
+        h = np.ascontiguousarray(h, dtype=np.float64)
+
+        try:
+            tables = self._table_arrays()
+        except RuntimeError:
+            # the section isn't table-backed; the recurrence still
+            # benefits from computing the stage-dependent
+            # coefficients for every step in one vectorized pass
+            return self._q_solve_sequential(h, h0, q0)
+
+        # convergence tolerance
+        tol = 1.0  # cfs
+
+        q = _q_solve_recurrence(
+            h, float(h0), float(q0), *tables,
+            self._l3_const, self._bed_over_sr2, self._inv_dt,
+            self._inv_g_dt, tol, 50)
+
+        nan_count = np.count_nonzero(np.isnan(q))
+        if nan_count:
+            self.logger.error(
+                "dynmod solver failed to converge at step "
+                + "{} of {}".format(q.size - nan_count, q.size))
+
+        return q
+
+    def _q_solve_sequential(self, h, h0, q0):
+        """Solves the discharge recurrence with batched coefficients
+
+        Only `l3` depends on the previous step's discharge, so the
+        remaining coefficients are computed for every step in one
+        vectorized pass and the per-step loop reduces to a scalar
+        Newton solve. Requires a cross section and friction that
+        accept array stages.
+        """
+
+        h_prime = np.empty_like(h)
+        h_prime[0] = h0
+        h_prime[1:] = h[:-1]
+
+        try:
+            l2, _, l4, l5, l6 = self._l_coefficients(h, h_prime, 0.0)
+            area_prime = np.asarray(self._sect.area(h_prime),
+                                    dtype=np.float64)
+        except (TypeError, ValueError):
+            raise RuntimeError(
+                "Cross section and friction must accept array stages "
+                + "to solve the recurrence")
+
+        inv_g_dt_over_ap = self._inv_g_dt / area_prime
+
+        # convergence tolerance
+        tol = 1.0  # cfs
+
+        q = np.full_like(h, np.nan)
+        q_p = float(q0)
+
+        for i in range(h.size):
+
+            l3 = self._l3_const + q_p * inv_g_dt_over_ap[i]
+
+            root, _ = _newton_q(q_p, l2[i], l3, l4[i], l5[i], l6[i],
+                                tol, 50)
+
+            if not isfinite(root):
+                break
+
+            q[i] = root
+            q_p = root
+
+        nan_count = np.count_nonzero(np.isnan(q))
+        if nan_count:
+            self.logger.error(
+                "dynmod solver failed to converge at step "
+                + "{} of {}".format(q.size - nan_count, q.size))
+
+        return q
+
+    def q_solve_series(self, h, h_prime, q_prime, q0=None):
+        """Solves for discharge over a series of stage values
+
+        Vectorized form of :meth:`q_solve`. The cross section
+        properties and the coefficients of the zero function are
+        computed for all time steps in a single pass, and the
+        Newton iteration is run on the full arrays at once.
+
+        Parameters
+        ----------
+        h : array_like
+            Stage of current time steps
+        h_prime : array_like
+            Stage of previous time steps
+        q_prime : array_like
+            Discharge of previous time steps
+        q0 : {array_like, None}, optional
+            Initial estimates of q (the default is None, which uses
+            `q_prime` as initial estimates).
+
+        Returns
+        -------
+        numpy.ndarray
+            Computed discharge. Elements that failed to converge are
+            NaN.
+
+        """
+
+        h = np.asarray(h, dtype=np.float64)
+        h_prime = np.asarray(h_prime, dtype=np.float64)
+        q_prime = np.asarray(q_prime, dtype=np.float64)
+
+        area = self._sect.area(h)
+        top_width = self._sect.top_width(h)
+        wetted_perimeter = self._sect.wetted_perimeter(h)
+        area_prime = self._sect.area(h_prime)
+        wetted_perimeter_prime = self._sect.wetted_perimeter(h_prime)
+        n = self._frict.roughness(h)
+
+        dh = h - h_prime
+        dhs = dh * self._inv_dt
+
+        # where the stage is unchanged the wetted perimeter
+        # difference is zero, so the epsilon denominator yields
+        # K = 5/3 without a branch
+        dh_safe = np.where(dh == 0, 1e-9, dh)
+        dPdh = (wetted_perimeter - wetted_perimeter_prime) / dh_safe
+        k = 5 / 3 - 2 / 3 * (area / (top_width * wetted_perimeter)) * dPdh
+
+        hydraulic_depth = area / top_width
+
+        l2 = 1.486 * area * \
+            np.cbrt(hydraulic_depth * hydraulic_depth) / n
+        l3 = self._l3_const + q_prime * self._inv_g_dt / area_prime
+        l4 = area * dhs / k
+        l5 = (1 - 1 / k) * top_width * dhs / (GRAVITY * area * area) \
+            - self._inv_g_dt / area
+        l6 = -2 / 3 * (self._bed_over_sr2 * top_width) \
+            / (GRAVITY * area * area * area)
+
+        # convergence tolerance
+        tol = 1.0  # cfs
+
+        if q0 is None:
+            q0 = q_prime.copy()
+        else:
+            q0 = np.asarray(q0, dtype=np.float64).copy()
+
+        # hand-rolled array Newton iteration; the zero function and
+        # its derivative share l0 and its square root, which
+        # scipy.optimize.newton would evaluate twice per iteration
+        q = q0
+        converged = np.zeros(q.shape, dtype=bool)
+
+        for _ in range(50):
+
+            active = ~converged
+
+            inv_q = 1.0 / q
+            l0 = l3 + l4 * inv_q + l5 * q + l6 * q * q
+
+            valid = l0 > 0
+            sqrt_l0 = np.sqrt(np.where(valid, l0, 1.))
+
+            f = q - l2 * sqrt_l0
+            l1 = -l4 * inv_q * inv_q + l5 + 2 * l6 * q
+            f_prime = 1 - 0.5 * l2 * l1 / sqrt_l0
+
+            nonzero = f_prime != 0
+            step = np.where(valid & nonzero,
+                            f / np.where(nonzero, f_prime, 1.), np.nan)
+
+            q = np.where(active, q - step, q)
+            converged |= active & (np.abs(step) < tol)
+
+            if np.all(converged):
+                break
+
+        root = np.where(converged, q, np.nan)
+
+        if not np.all(converged):
+            self.logger.error(
+                "dynmod solver failed to converge for "
+                + "{} of {} time steps".format(
+                    np.count_nonzero(~converged), converged.size))
+
+        return root
 
     def q_solve(self, h, h_prime, q_prime, q0=None):
         """Iteratively solves for discharge
@@ -198,11 +726,7 @@ class QSolver:
 
         """
 
-        l2 = self._L2(h)
-        l3 = self._L3(q_prime, h_prime)
-        l4 = self._L4(h, h_prime)
-        l5 = self._L5(h, h_prime)
-        l6 = self._L6(h)
+        l2, l3, l4, l5, l6 = self._l_coefficients(h, h_prime, q_prime)
 
         # convergence tolerance
         tol = 1.0  # cfs
@@ -210,22 +734,16 @@ class QSolver:
         if q0 is None:
             q0 = q_prime
 
-        root, r = newton(
-            lambda q: self._f(
-                q, l2, l3, l4, l5, l6),
-            q0,
-            lambda q: self._f_prime(
-                q, l2, l3, l4, l5, l6),
-            full_output=True, tol=tol, disp=False)
+        root, iterations = _newton_q(float(q0), l2, l3, l4, l5, l6, tol, 50)
 
-        if not r.converged:
+        if not isfinite(root):
             self.logger.error("dynmod solver failed to converge after "
-                              + "{} iterations".format(r.iterations))
+                              + "{} iterations".format(iterations))
             raise RuntimeError("dynmod zero function failed to converge")
-        else:
+        elif self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug("Converged to value " +
                               "{} after {} iterations".format(root,
-                                                              r.iterations))
+                                                              iterations))
 
         return root
 
@@ -235,15 +753,21 @@ class QSolver:
 
         Parameters
         ----------
-        h : float
+        h : float or array_like
             Stage of current time step
-        h_prime : float
+        h_prime : float or array_like
             Stage of previous time step
-        q : float
+        q : float or array_like
             Discharge of current time step
-        q_prime : float
+        q_prime : float or array_like
             Discharge of previous time step
 
+        Returns
+        -------
+        float or numpy.ndarray
+            Residual of the zero function. Array inputs broadcast
+            and yield an array of residuals.
+
         Notes
         -----
 
@@ -251,10 +775,6 @@ class QSolver:
 
         """
 
-        l2 = self._L2(h)
-        l3 = self._L3(q_prime, h_prime)
-        l4 = self._L4(h, h_prime)
-        l5 = self._L5(h, h_prime)
-        l6 = self._L6(h)
+        l2, l3, l4, l5, l6 = self._l_coefficients(h, h_prime, q_prime)
 
         return self._f(q, l2, l3, l4, l5, l6)
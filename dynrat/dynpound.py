@@ -8,16 +8,209 @@ References
 
 """
 
+import logging
+from collections import deque
+from math import isfinite
+
 import numpy as np
-from scipy.optimize import newton
+from scipy.interpolate import CubicSpline
 
 import dynrat
 from dynrat import GRAVITY
 
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
 
 logger = dynrat.logger.getChild(__name__)
 
 
+def _make_zero_func_kernel():
+    """Builds the arithmetic kernel used by :meth:`Solver.zero_func`.
+
+    The kernel receives precomputed section scalars and performs the
+    floating-point work of the zero function. When Numba is
+    available, the kernel is compiled in nopython mode and cached on
+    disk.
+
+    """
+
+    def zero_func_kernel(dh, dq, q, area, da, beta, top_width, celerity,
+                         conveyance, dt, bed_slope, two_thirds_s0_sr2):
+
+        y_partial = -1/celerity*dh/dt - two_thirds_s0_sr2
+
+        inv_area = 1.0/area
+        inv_g_area = inv_area/GRAVITY
+        inv_area2 = inv_area*inv_area
+
+        term_1 = inv_g_area*dq/dt
+        term_2 = beta*(2*q)*inv_g_area*inv_area * da/dt
+        term_3 = (1 - beta*top_width*q*q*inv_g_area*inv_area2)*y_partial
+
+        q_inv_k = q/conveyance
+        s_f = q_inv_k*q_inv_k
+
+        return term_1 - term_2 + term_3 + s_f - bed_slope
+
+    if _HAVE_NUMBA:
+        zero_func_kernel = njit(fastmath=True, cache=True, nogil=True,
+                                error_model='numpy')(zero_func_kernel)
+
+    return zero_func_kernel
+
+
+_zero_func_kernel = _make_zero_func_kernel()
+
+
+def _make_h_solve_recurrence():
+    """Builds the sequential stage-recurrence kernel.
+
+    The kernel runs the whole stage series in one call, carrying
+    each step's root into the next, with the zero function and its
+    finite-difference derivative inlined and every section property
+    interpolated linearly on the breakpoint arrays. When Numba is
+    available, the kernel is compiled in nopython mode and cached on
+    disk.
+
+    """
+
+    def resid(h, h_p, q, q_p, stage, area_tbl, conveyance_tbl,
+              top_width_tbl, wp_tbl, beta_tbl, mode, dt, bed_slope,
+              sqrt_bed_slope, two_thirds_s0_sr2):
+
+        area = np.interp(h, stage, area_tbl)
+        area_p = np.interp(h_p, stage, area_tbl)
+        da = area - area_p
+
+        beta = np.interp(h, stage, beta_tbl)
+        top_width = np.interp(h, stage, top_width_tbl)
+        conveyance = np.interp(h, stage, conveyance_tbl)
+
+        dh = h - h_p
+        dq = q - q_p
+
+        if mode == 0:
+            # const k
+            celerity = 1.7*q/area
+        elif mode == 1:
+            # k
+            dh_safe = dh if dh != 0.0 else 1e-9
+            wp = np.interp(h, stage, wp_tbl)
+            wp_p = np.interp(h_p, stage, wp_tbl)
+            dPdh = (wp - wp_p)/dh_safe
+            k = 5/3 - 2/3*(area/(top_width*wp))*dPdh
+            celerity = k*q/area
+        elif mode == 2:
+            # dqda
+            min_abs = 1e-9
+            dq_c = dq
+            if dq_c == 0:
+                dq_c = min_abs
+            elif abs(dq_c) < min_abs:
+                dq_c = min_abs if dq_c > 0 else -min_abs
+            da_c = da
+            if da_c == 0:
+                da_c = min_abs
+            elif abs(da_c) < min_abs:
+                da_c = min_abs if da_c > 0 else -min_abs
+            celerity = dq_c/da_c
+        else:
+            # dkda
+            ddh = 0.01
+            da_d = np.interp(h + ddh/2, stage, area_tbl) - \
+                np.interp(h - ddh/2, stage, area_tbl)
+            dk_d = np.interp(h + ddh/2, stage, conveyance_tbl) - \
+                np.interp(h - ddh/2, stage, conveyance_tbl)
+            celerity = sqrt_bed_slope*dk_d/da_d
+
+        y_partial = -1/celerity*dh/dt - two_thirds_s0_sr2
+
+        inv_area = 1.0/area
+        inv_g_area = inv_area/GRAVITY
+        inv_area2 = inv_area*inv_area
+
+        term_1 = inv_g_area*dq/dt
+        term_2 = beta*(2*q)*inv_g_area*inv_area * da/dt
+        term_3 = (1 - beta*top_width*q*q*inv_g_area*inv_area2)*y_partial
+
+        q_inv_k = q/conveyance
+        s_f = q_inv_k*q_inv_k
+
+        return term_1 - term_2 + term_3 + s_f - bed_slope
+
+    if _HAVE_NUMBA:
+        resid = njit(cache=True, nogil=True, error_model='numpy')(resid)
+
+    def h_solve_recurrence(q, h0, q0, stage, area_tbl, conveyance_tbl,
+                           top_width_tbl, wp_tbl, beta_tbl, mode, dt,
+                           bed_slope, sqrt_bed_slope,
+                           two_thirds_s0_sr2, tol, maxiter):
+
+        n = q.shape[0]
+        h = np.empty(n)
+
+        h_p = h0
+        q_p = q0
+
+        # centered-difference stage increment, as in zero_func_prime
+        dh_fd = 0.01
+
+        for i in range(n):
+
+            q_i = q[i]
+            x = h_p
+            converged = False
+
+            for _ in range(maxiter):
+
+                f = resid(x, h_p, q_i, q_p, stage, area_tbl,
+                          conveyance_tbl, top_width_tbl, wp_tbl,
+                          beta_tbl, mode, dt, bed_slope,
+                          sqrt_bed_slope, two_thirds_s0_sr2)
+                fp = (resid(x + dh_fd/2, h_p, q_i, q_p, stage,
+                            area_tbl, conveyance_tbl, top_width_tbl,
+                            wp_tbl, beta_tbl, mode, dt, bed_slope,
+                            sqrt_bed_slope, two_thirds_s0_sr2)
+                      - resid(x - dh_fd/2, h_p, q_i, q_p, stage,
+                              area_tbl, conveyance_tbl,
+                              top_width_tbl, wp_tbl, beta_tbl, mode,
+                              dt, bed_slope, sqrt_bed_slope,
+                              two_thirds_s0_sr2))/dh_fd
+
+                if fp == 0 or not np.isfinite(fp):
+                    break
+
+                step = f/fp
+                x = x - step
+
+                if abs(step) < tol:
+                    converged = True
+                    break
+
+            if not converged or not np.isfinite(x):
+                h[i:] = np.nan
+                return h
+
+            h[i] = x
+            h_p = x
+            q_p = q_i
+
+        return h
+
+    if _HAVE_NUMBA:
+        h_solve_recurrence = njit(cache=True, nogil=True,
+                                  error_model='numpy')(h_solve_recurrence)
+
+    return h_solve_recurrence
+
+
+_h_solve_recurrence = _make_h_solve_recurrence()
+
+
 class Solver:
 
     def __init__(self, sect, bed_slope, slope_ratio, time_step, c_comp='dkda'):
@@ -33,73 +226,223 @@ class Solver:
 
         self._c_comp = c_comp
 
+        # constants derived from the slope parameters, computed once
+        # instead of on every zero function evaluation
+        self._sqrt_bed_slope = bed_slope**0.5
+        self._slope_ratio_sq = slope_ratio**2
+        self._two_thirds_s0_over_sr2 = \
+            2/3*bed_slope/self._slope_ratio_sq
+
+        # resolve the celerity computation method once instead of
+        # branching on the method name on every evaluation
+        self._celerity = {'const k': self._celerity_const_k,
+                          'k': self._celerity_k,
+                          'dqda': self._celerity_dqda,
+                          'dkda': self._celerity_dkda}[c_comp]
+
+        # per-solve cache of cross section evaluations, cleared at
+        # the beginning of each root find
+        self._sect_cache = {}
+
+        # the last two computed roots, used to warm-start the next
+        # solve by linear extrapolation
+        self._root_history = deque(maxlen=2)
+
+        # spline-backed property tables, built once when the cross
+        # section exposes its breakpoint arrays (CrossSect wraps a
+        # TableSect in its _sect attribute); derivatives of the
+        # conveyance and area splines replace the centered
+        # difference in the dkda celerity computation
+        self._splines = None
+        self._da_dh = None
+        self._dk_dh = None
+
+        # sections that can return a property and its derivative in
+        # one lookup save one call per derivative in _sect_state
+        self._has_sect_derivatives = (
+            hasattr(sect, 'area_and_derivative')
+            and hasattr(sect, 'conveyance_and_derivative'))
+
+        table = getattr(sect, '_sect', sect)
+        stage = getattr(table, '_stage', None)
+
+        if stage is not None and np.all(np.diff(stage) > 0):
+            try:
+                self._splines = {
+                    'area': CubicSpline(stage, table._area),
+                    'conveyance': CubicSpline(stage, table._conveyance),
+                    'top_width': CubicSpline(stage, table._top_width),
+                    'wetted_perimeter':
+                        CubicSpline(stage, table._wetted_perimeter),
+                    'vel_dist_factor':
+                        CubicSpline(stage, table._vel_dist_factor),
+                }
+            except AttributeError:
+                self._splines = None
+            else:
+                self._da_dh = self._splines['area'].derivative()
+                self._dk_dh = self._splines['conveyance'].derivative()
+
         self.logger = logger.getChild(self.__class__.__name__)
 
-    def _celerity(self, h, h_prime, q, q_prime):
+    def _sect_value(self, method, h):
+        """Returns a cross section property, caching the result.
+
+        The iterative solvers evaluate the zero function many times
+        per root, and the previous-step properties are identical for
+        every evaluation. Caching by method name and stage means each
+        unique stage hits the cross section once per solve.
+        """
+
+        if self._splines is not None:
+            return float(self._splines[method](h))
+
+        key = (method, round(h, 6))
+
+        try:
+            return self._sect_cache[key]
+        except KeyError:
+            value = getattr(self._sect, method)(h)
+            self._sect_cache[key] = value
+            return value
+
+    def _sect_state(self, h):
+        """Returns the section quantities used by the zero function.
+
+        Consolidates the property lookups and the area and
+        conveyance derivatives at a stage so the celerity
+        computation and the stage derivative share them. The
+        derivatives come from the property splines when available
+        and from a centered difference through the per-solve cache
+        otherwise.
+        """
+
+        state = {'top_width': self._sect_value('top_width', h),
+                 'wetted_perimeter':
+                     self._sect_value('wetted_perimeter', h),
+                 'vel_dist_factor':
+                     self._sect_value('vel_dist_factor', h)}
+
+        if self._da_dh is not None:
+            state['area'] = self._sect_value('area', h)
+            state['conveyance'] = self._sect_value('conveyance', h)
+            state['da_dh'] = float(self._da_dh(h))
+            state['dk_dh'] = float(self._dk_dh(h))
+        elif self._has_sect_derivatives:
+            state['area'], state['da_dh'] = \
+                self._sect.area_and_derivative(h)
+            state['conveyance'], state['dk_dh'] = \
+                self._sect.conveyance_and_derivative(h)
+        else:
+            state['area'] = self._sect_value('area', h)
+            state['conveyance'] = self._sect_value('conveyance', h)
+            dh = 0.01
+            state['da_dh'] = (self._sect_value('area', h + dh/2)
+                              - self._sect_value('area', h - dh/2))/dh
+            state['dk_dh'] = (self._sect_value('conveyance', h + dh/2)
+                              - self._sect_value('conveyance',
+                                                 h - dh/2))/dh
 
-        if self._c_comp == 'const k':
+        return state
 
-            area = self._sect.area(h)
+    def _newton_solve(self, func, fprime, x0, tol, maxiter=50):
+        """Newton-Raphson iteration with a secant fallback.
 
-            k = 1.7
+        The tolerances used by the solvers are loose, so only a few
+        iterations are needed; a minimal loop avoids the per-call
+        bookkeeping of scipy.optimize.newton. When the derivative
+        vanishes, the step falls back to a secant estimate from the
+        previous iterate.
 
-            celerity = k * q/area
+        Returns a tuple of the root estimate, the number of
+        iterations, and a convergence flag.
+        """
 
-        elif self._c_comp == 'k':
+        x = x0
+        x_last = None
+        f_last = None
 
-            area = self._sect.area(h)
+        for i in range(maxiter):
 
-            k = self._K(h, h_prime)
+            f = func(x)
+            fp = fprime(x)
 
-            celerity = k * q/area
+            if fp == 0 or not isfinite(fp):
+                if x_last is not None and f != f_last:
+                    fp = (f - f_last)/(x - x_last)
+                else:
+                    fp = (func(x + tol) - f)/tol
+                if fp == 0:
+                    return x, i + 1, False
 
-        elif self._c_comp == 'dqda':
+            step = f/fp
 
-            min_abs_dq = 1e-9
-            dq = q - q_prime
-            if dq == 0:
-                dq = min_abs_dq
-            elif np.abs(dq) < 0:
-                dq = np.sign(dq)*min_abs_dq
-
-            area = self._sect.area(h)
-            area_prime = self._sect.area(h_prime)
-            da = area - area_prime
-            min_abs_da = 1e-9
-            if da == 0:
-                da = min_abs_da
-            elif np.abs(da) < 0:
-                da = np.sign(da)*min_abs_da
+            x_last = x
+            f_last = f
+            x = x - step
 
-            celerity = dq/da
+            if abs(step) < tol:
+                return x, i + 1, True
 
-        elif self._c_comp == 'dkda':
+        return x, maxiter, False
 
-            dh = 0.01
+    def _celerity_const_k(self, h, h_prime, q, q_prime):
 
-            da = self._sect.area(h + dh/2) - \
-                self._sect.area(h - dh/2)
+        area = self._sect_value('area', h)
 
-            dk = self._sect.conveyance(h + dh/2) - \
-                self._sect.conveyance(h - dh/2)
+        k = 1.7
 
-            celerity = self._bed_slope**(1/2)*dk/da
+        return k * q/area
 
-        return celerity
+    def _celerity_k(self, h, h_prime, q, q_prime):
+
+        area = self._sect_value('area', h)
+
+        k = self._K(h, h_prime)
+
+        return k * q/area
+
+    def _celerity_dqda(self, h, h_prime, q, q_prime):
+
+        min_abs_dq = 1e-9
+        dq = q - q_prime
+        if dq == 0:
+            dq = min_abs_dq
+        elif np.abs(dq) < min_abs_dq:
+            dq = np.sign(dq)*min_abs_dq
+
+        area = self._sect_value('area', h)
+        area_prime = self._sect_value('area', h_prime)
+        da = area - area_prime
+        min_abs_da = 1e-9
+        if da == 0:
+            da = min_abs_da
+        elif np.abs(da) < min_abs_da:
+            da = np.sign(da)*min_abs_da
+
+        return dq/da
+
+    def _celerity_dkda(self, h, h_prime, q, q_prime):
+
+        state = self._sect_state(h)
+
+        return self._sqrt_bed_slope*state['dk_dh']/state['da_dh']
 
     def _K(self, h, h_prime):
 
+        # when dh is zero the wetted perimeter difference is also
+        # zero, so an epsilon denominator yields K = 5/3 exactly
+        # without branching on the stage difference
         dh = h - h_prime
+        if dh == 0.0:
+            dh = 1e-9
 
-        if dh == 0:
-            k = 5/3
-        else:
-            top_width = self._sect.top_width(h)
-            wetted_perimeter = self._sect.wetted_perimeter(h)
-            wetted_perimeter_prime = self._sect.wetted_perimeter(h_prime)
-            area = self._sect.area(h)
-            dPdh = (wetted_perimeter - wetted_perimeter_prime)/dh
-            k = 5 / 3 - 2 / 3 * (area / (top_width * wetted_perimeter)) * dPdh
+        top_width = self._sect_value('top_width', h)
+        wetted_perimeter = self._sect_value('wetted_perimeter', h)
+        wetted_perimeter_prime = self._sect_value('wetted_perimeter', h_prime)
+        area = self._sect_value('area', h)
+        dPdh = (wetted_perimeter - wetted_perimeter_prime)/dh
+        k = 5 / 3 - 2 / 3 * (area / (top_width * wetted_perimeter)) * dPdh
 
         if k < 0:
             self.logger.warning("K = {} < 0".format(k))
@@ -108,13 +451,15 @@ class Solver:
 
     def zero_func(self, h, h_prime, q, q_prime):
 
-        area = self._sect.area(h)
-        area_prime = self._sect.area(h_prime)
+        state = self._sect_state(h)
+
+        area = state['area']
+        area_prime = self._sect_value('area', h_prime)
         da = area - area_prime
 
-        beta = self._sect.vel_dist_factor(h)
+        beta = state['vel_dist_factor']
 
-        top_width = self._sect.top_width(h)
+        top_width = state['top_width']
 
         dh = h - h_prime
         dq = q - q_prime
@@ -123,35 +468,259 @@ class Solver:
 
         dt = self._time_step
 
-        y_partial = -1/celerity*dh/dt - \
-            2/3*self._bed_slope/self._slope_ratio**2
-
-        term_1 = 1/(GRAVITY*area)*dq/dt
-        term_2 = beta*(2*q)/(GRAVITY*area**2) * da/dt
-        term_3 = (1 - beta*top_width*q **
-                  2/(GRAVITY*area**3))*y_partial
-
-        k = self._sect.conveyance(h)
-        s_f = (q/k)**2
-
-        f = term_1 - term_2 + term_3 + s_f - self._bed_slope
-
-        if not np.isfinite(f):
-            self.logger.error("f computed a non-finite value")
-            if not np.isfinite(term_1):
-                self.logger.debug("term_1 is not finite")
-            if not np.isfinite(term_2):
-                self.logger.debug("term_2 is not finite")
-            if not np.isfinite(term_3):
-                self.logger.debug("term_3 is not finite")
-            if not np.isfinite(y_partial):
-                self.logger.debug("y_partial is not finite")
-            if not np.isfinite(s_f):
-                self.logger.debug("s_f is not finite")
+        k = state['conveyance']
+
+        f = _zero_func_kernel(dh, dq, q, area, da, beta, top_width,
+                              celerity, k, dt, self._bed_slope,
+                              self._two_thirds_s0_over_sr2)
+
+        if not isfinite(f):
+            self._diagnose_non_finite(dh, dq, q, area, da, beta,
+                                      top_width, celerity, k, dt)
             raise RuntimeError("Non-finite value computed")
 
         return f
 
+    def _diagnose_non_finite(self, dh, dq, q, area, da, beta, top_width,
+                             celerity, conveyance, dt):
+        """Logs which term of the zero function went non-finite.
+
+        Recomputes the terms in Python; only runs when the kernel
+        returns a non-finite value.
+        """
+
+        self.logger.error("f computed a non-finite value")
+
+        # numpy scalars divide to inf/NaN instead of raising, so
+        # the diagnostic survives the zero denominators it exists
+        # to report
+        celerity = np.float64(celerity)
+        area = np.float64(area)
+        conveyance = np.float64(conveyance)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            y_partial = -1/celerity*dh/dt - self._two_thirds_s0_over_sr2
+
+            term_1 = 1/(GRAVITY*area)*dq/dt
+            term_2 = beta*(2*q)/(GRAVITY*area**2) * da/dt
+            term_3 = (1 - beta*top_width*q **
+                      2/(GRAVITY*area**3))*y_partial
+            s_f = (q/conveyance)**2
+
+        if not np.isfinite(term_1):
+            self.logger.debug("term_1 is not finite")
+        if not np.isfinite(term_2):
+            self.logger.debug("term_2 is not finite")
+        if not np.isfinite(term_3):
+            self.logger.debug("term_3 is not finite")
+        if not np.isfinite(y_partial):
+            self.logger.debug("y_partial is not finite")
+        if not np.isfinite(s_f):
+            self.logger.debug("s_f is not finite")
+
+    def _table_arrays(self):
+        """Returns the breakpoint arrays of a table-backed cross
+        section as contiguous float64 arrays.
+
+        Raises a RuntimeError when the cross section does not expose
+        breakpoint arrays.
+        """
+
+        # CrossSect wraps a TableSect in its _sect attribute
+        table = getattr(self._sect, '_sect', self._sect)
+
+        try:
+            stage = table._stage
+            area = table._area
+            conveyance = table._conveyance
+            top_width = table._top_width
+            wetted_perimeter = table._wetted_perimeter
+            vel_dist_factor = table._vel_dist_factor
+        except AttributeError:
+            raise RuntimeError(
+                "Cross section must be table-backed to solve on "
+                + "breakpoint arrays")
+
+        return (np.ascontiguousarray(stage, dtype=np.float64),
+                np.ascontiguousarray(area, dtype=np.float64),
+                np.ascontiguousarray(conveyance, dtype=np.float64),
+                np.ascontiguousarray(top_width, dtype=np.float64),
+                np.ascontiguousarray(wetted_perimeter, dtype=np.float64),
+                np.ascontiguousarray(vel_dist_factor, dtype=np.float64))
+
+    def _sect_array(self, method, h):
+        """Returns a cross section property for an array of stages."""
+
+        if self._splines is not None:
+            return self._splines[method](h)
+
+        return getattr(self._sect, method)(h)
+
+    def _celerity_batch(self, h, h_prime, q, q_prime):
+        """Vectorized form of :meth:`_celerity` for array stages."""
+
+        if self._c_comp == 'const k':
+
+            celerity = 1.7*q/self._sect_array('area', h)
+
+        elif self._c_comp == 'k':
+
+            dh = h - h_prime
+            dh_safe = np.where(dh == 0, 1e-9, dh)
+
+            top_width = self._sect_array('top_width', h)
+            wetted_perimeter = self._sect_array('wetted_perimeter', h)
+            wetted_perimeter_prime = self._sect_array('wetted_perimeter',
+                                                      h_prime)
+            area = self._sect_array('area', h)
+            dPdh = (wetted_perimeter - wetted_perimeter_prime)/dh_safe
+            k = 5/3 - 2/3*(area/(top_width*wetted_perimeter))*dPdh
+
+            celerity = k*q/area
+
+        elif self._c_comp == 'dqda':
+
+            min_abs_dq = 1e-9
+            dq = q - q_prime
+            dq = np.where(dq == 0, min_abs_dq, dq)
+
+            da = self._sect_array('area', h) \
+                - self._sect_array('area', h_prime)
+            min_abs_da = 1e-9
+            da = np.where(da == 0, min_abs_da, da)
+
+            celerity = dq/da
+
+        else:
+
+            if self._dk_dh is not None:
+
+                celerity = self._sqrt_bed_slope * \
+                    self._dk_dh(h)/self._da_dh(h)
+
+            else:
+
+                dh = 0.01
+
+                da = self._sect_array('area', h + dh/2) - \
+                    self._sect_array('area', h - dh/2)
+
+                dk = self._sect_array('conveyance', h + dh/2) - \
+                    self._sect_array('conveyance', h - dh/2)
+
+                celerity = self._sqrt_bed_slope*dk/da
+
+        return celerity
+
+    def _zero_func_batch(self, h, h_prime, q, q_prime):
+        """Vectorized form of :meth:`zero_func` for array stages.
+
+        Queries the cross section with arrays directly instead of
+        going through the per-solve scalar cache. Non-finite lanes
+        are returned as-is rather than raising.
+        """
+
+        area = self._sect_array('area', h)
+        area_prime = self._sect_array('area', h_prime)
+        da = area - area_prime
+
+        beta = self._sect_array('vel_dist_factor', h)
+
+        top_width = self._sect_array('top_width', h)
+
+        dh = h - h_prime
+        dq = q - q_prime
+
+        celerity = self._celerity_batch(h, h_prime, q, q_prime)
+
+        # bind attributes and globals referenced more than once to
+        # locals, and share the 1/(g A) factor between terms
+        dt = self._time_step
+        s0 = self._bed_slope
+        g = GRAVITY
+
+        k = self._sect_array('conveyance', h)
+
+        y_partial = -1/celerity*dh/dt - self._two_thirds_s0_over_sr2
+
+        inv_area = 1/area
+        inv_g_area = inv_area/g
+        inv_area2 = inv_area*inv_area
+
+        term_1 = inv_g_area*dq/dt
+        term_2 = beta*(2*q)*inv_g_area*inv_area * da/dt
+        term_3 = (1 - beta*top_width*q*q*inv_g_area*inv_area2)*y_partial
+
+        q_inv_k = q/k
+        s_f = q_inv_k*q_inv_k
+
+        return term_1 - term_2 + term_3 + s_f - s0
+
+    def zero_func_prime(self, h, h_prime, q, q_prime):
+        """Derivative of the zero function with respect to h.
+
+        Computed with a centered difference using the same stage
+        increment as the conveyance derivative in the celerity
+        computation.
+        """
+
+        dh = 0.01
+
+        f_plus = self.zero_func(h + dh/2, h_prime, q, q_prime)
+        f_minus = self.zero_func(h - dh/2, h_prime, q, q_prime)
+
+        return (f_plus - f_minus)/dh
+
+    def zero_func_prime_q(self, h, h_prime, q, q_prime):
+        """Derivative of the zero function with respect to q.
+
+        The cross section properties do not depend on q, so the
+        derivative is analytic.
+        """
+
+        area = self._sect_value('area', h)
+        area_prime = self._sect_value('area', h_prime)
+        da = area - area_prime
+
+        beta = self._sect_value('vel_dist_factor', h)
+
+        top_width = self._sect_value('top_width', h)
+
+        dh = h - h_prime
+
+        celerity = self._celerity(h, h_prime, q, q_prime)
+
+        dt = self._time_step
+
+        y_partial = -1/celerity*dh/dt - self._two_thirds_s0_over_sr2
+
+        # derivative of celerity with respect to q
+        if self._c_comp == 'const k':
+            dc_dq = 1.7/area
+        elif self._c_comp == 'k':
+            dc_dq = self._K(h, h_prime)/area
+        elif self._c_comp == 'dqda':
+            min_abs_da = 1e-9
+            if da == 0:
+                da_safe = min_abs_da
+            else:
+                da_safe = da
+            dc_dq = 1/da_safe
+        else:
+            dc_dq = 0
+
+        dy_partial_dq = dh/dt/celerity**2*dc_dq
+
+        term_1_prime = 1/(GRAVITY*area*dt)
+        term_2_prime = beta*2/(GRAVITY*area**2) * da/dt
+        term_3_prime = -beta*top_width*(2*q)/(GRAVITY*area**3)*y_partial + \
+            (1 - beta*top_width*q**2/(GRAVITY*area**3))*dy_partial_dq
+
+        k = self._sect_value('conveyance', h)
+        s_f_prime = 2*q/k**2
+
+        return term_1_prime - term_2_prime + term_3_prime + s_f_prime
+
 
 class HSolver(Solver):
     """DYNPOUND stage solver
@@ -207,23 +776,160 @@ class HSolver(Solver):
 
     def h_solve(self, q, q_prime, h_prime, h0=None):
 
+        self._sect_cache.clear()
+
         # convergence tolerance
         tol = 0.1
 
         if h0 is None:
-            h0 = h_prime
-
-        root, r = newton(lambda h: self.zero_func(
-            h, h_prime, q, q_prime), h0, tol=tol, full_output=True, disp=False)
-
-        if not r.converged:
+            # extrapolate from the last two roots, but only when the
+            # history chains into this call (h_prime is the previous
+            # root, as in a recurrence); a reused solver starting a
+            # new series must not warm-start from stale roots
+            if len(self._root_history) == 2 and \
+                    self._root_history[-1] == h_prime:
+                h0 = 2*h_prime - self._root_history[0]
+            else:
+                h0 = h_prime
+
+        root, iterations, converged = self._newton_solve(
+            lambda h: self.zero_func(h, h_prime, q, q_prime),
+            lambda h: self.zero_func_prime(h, h_prime, q, q_prime),
+            h0, tol)
+
+        if not converged:
             self.logger.error("dynpound solver failed to converge after "
-                              + "{} iterations".format(r.iterations))
+                              "%s iterations", iterations)
             raise RuntimeError("dynpound zero function failed to converge")
+        elif self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Converged to value %s after %s iterations",
+                              root, iterations)
+
+        self._root_history.append(root)
+
+        return root
+
+    def h_solve_recurrence(self, q, q0, h0):
+        """Solves the stage recurrence over a discharge series
+
+        Computes the whole series in one compiled (or single Python)
+        call, feeding each step's computed stage into the next,
+        exactly as a per-step :meth:`h_solve` loop would. Requires a
+        table-backed cross section (:class:`.TableSect` or
+        :class:`.CrossSect`); properties are interpolated linearly
+        on the breakpoint arrays.
+
+        Parameters
+        ----------
+        q : array_like
+            Discharge series
+        q0 : float
+            Discharge of the time step before `q[0]`
+        h0 : float
+            Stage of the time step before `q[0]`
+
+        Returns
+        -------
+        numpy.ndarray
+            Computed stage. If a step fails to converge, that
+            element and all following elements are NaN.
+
+        """
+
+        q = np.ascontiguousarray(q, dtype=np.float64)
+
+        tables = self._table_arrays()
+
+        mode = ['const k', 'k', 'dqda', 'dkda'].index(self._c_comp)
+
+        # convergence tolerance
+        tol = 0.1
+
+        h = _h_solve_recurrence(
+            q, float(h0), float(q0), *tables, mode, self._time_step,
+            self._bed_slope, self._sqrt_bed_slope,
+            self._two_thirds_s0_over_sr2, tol, 50)
+
+        nan_count = np.count_nonzero(np.isnan(h))
+        if nan_count:
+            self.logger.error(
+                "dynpound solver failed to converge at step "
+                + "{} of {}".format(h.size - nan_count, h.size))
+
+        return h
+
+    def h_solve_batch(self, q, q_prime, h_prime, h0=None):
+        """Solves for stage for a batch of independent solves
+
+        Vectorized form of :meth:`h_solve` for ensembles or multiple
+        independent sections sharing solver parameters. The Newton
+        iteration runs on the full arrays at once, masking lanes as
+        they converge. Requires the cross section to accept array
+        stages.
+
+        Parameters
+        ----------
+        q : array_like
+            Discharge of current time steps
+        q_prime : array_like
+            Discharge of previous time steps
+        h_prime : array_like
+            Stage of previous time steps
+        h0 : {array_like, None}, optional
+            Initial estimates of h (the default is None, which uses
+            `h_prime` as initial estimates).
+
+        Returns
+        -------
+        numpy.ndarray
+            Computed stage. Elements that failed to converge are NaN.
+
+        """
+
+        q = np.asarray(q, dtype=np.float64)
+        q_prime = np.asarray(q_prime, dtype=np.float64)
+        h_prime = np.asarray(h_prime, dtype=np.float64)
+
+        # convergence tolerance
+        tol = 0.1
+
+        if h0 is None:
+            h0 = h_prime.copy()
         else:
-            self.logger.debug("Converged to value " +
-                              "{} after {} iterations".format(root,
-                                                              r.iterations))
+            h0 = np.asarray(h0, dtype=np.float64).copy()
+
+        # centered-difference stage increment, as in zero_func_prime
+        dh = 0.01
+
+        h = h0
+        converged = np.zeros(h.shape, dtype=bool)
+
+        for _ in range(50):
+
+            active = ~converged
+
+            f = self._zero_func_batch(h, h_prime, q, q_prime)
+            fp = (self._zero_func_batch(h + dh/2, h_prime, q, q_prime)
+                  - self._zero_func_batch(h - dh/2, h_prime, q,
+                                          q_prime))/dh
+
+            nonzero = fp != 0
+            step = np.where(nonzero,
+                            f/np.where(nonzero, fp, 1.), np.nan)
+
+            h = np.where(active, h - step, h)
+            converged |= active & (np.abs(step) < tol)
+
+            if np.all(converged):
+                break
+
+        root = np.where(converged, h, np.nan)
+
+        if not np.all(converged):
+            self.logger.error(
+                "dynpound solver failed to converge for "
+                + "{} of {} solves".format(
+                    np.count_nonzero(~converged), converged.size))
 
         return root
 
@@ -282,22 +988,35 @@ class QSolver(Solver):
 
     def q_solve(self, h, h_prime, q_prime, q0=None):
 
+        self._sect_cache.clear()
+
         # convergence tolerance
         tol = 1  # cfs
 
         if q0 is None:
-            q0 = q_prime
-
-        root, r = newton(lambda q: self.zero_func(
-            h, h_prime, q, q_prime), q0, tol=tol, full_output=True, disp=False)
-
-        if not r.converged:
+            # extrapolate from the last two roots, but only when the
+            # history chains into this call (q_prime is the previous
+            # root, as in a recurrence); a reused solver starting a
+            # new series must not warm-start from stale roots
+            if len(self._root_history) == 2 and \
+                    self._root_history[-1] == q_prime:
+                q0 = 2*q_prime - self._root_history[0]
+            else:
+                q0 = q_prime
+
+        root, iterations, converged = self._newton_solve(
+            lambda q: self.zero_func(h, h_prime, q, q_prime),
+            lambda q: self.zero_func_prime_q(h, h_prime, q, q_prime),
+            q0, tol)
+
+        if not converged:
             self.logger.error("dynpound solver failed to converge after "
-                              + "{} iterations".format(r.iterations))
+                              "%s iterations", iterations)
             raise RuntimeError("dynpound zero function failed to converge")
-        else:
-            self.logger.debug("Converged to value " +
-                              "{} after {} iterations".format(root,
-                                                              r.iterations))
+        elif self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Converged to value %s after %s iterations",
+                              root, iterations)
+
+        self._root_history.append(root)
 
         return root
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from functools import lru_cache
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -31,8 +32,8 @@ class TableFrict(Frict):
 
     def __init__(self, stage, roughness):
 
-        self._stage = np.array(stage)
-        self._roughness = np.array(roughness)
+        self._stage = np.ascontiguousarray(stage, dtype=np.float64)
+        self._roughness = np.ascontiguousarray(roughness, dtype=np.float64)
 
         if self._stage.ndim != 1:
             raise ValueError("stage must be one-dimensional")
@@ -40,7 +41,7 @@ class TableFrict(Frict):
         if self._stage.size < 2:
             raise ValueError("stage must at least have two elements")
 
-        if not np.alltrue(np.diff(stage) >= 0):
+        if not np.all(np.diff(self._stage) >= 0):
             raise ValueError("stage must be sorted in ascending order")
 
         if self._roughness.ndim != 1:
@@ -52,6 +53,44 @@ class TableFrict(Frict):
         if self._stage.size != self._roughness.size:
             raise ValueError("stage and roughness must have the same size")
 
+        # per-segment slopes, computed once so roughness() can do a
+        # searchsorted plus a multiply-add instead of a full interp
+        d_stage = np.diff(self._stage)
+        d_roughness = np.diff(self._roughness)
+        self._slope = np.where(d_stage > 0,
+                               d_roughness / np.where(d_stage > 0,
+                                                      d_stage, 1.),
+                               0.)
+
+        # per-instance cache so exact repeats of a scalar stage skip
+        # the table lookup; long time series commonly hold quantized
+        # stage values
+        self._scalar_roughness = lru_cache(maxsize=1024)(self._interp)
+
+    def __getstate__(self):
+
+        # the lru_cache wrapper isn't picklable; drop it and
+        # rebuild an empty cache on unpickling
+        state = self.__dict__.copy()
+        del state['_scalar_roughness']
+
+        return state
+
+    def __setstate__(self, state):
+
+        self.__dict__.update(state)
+        self._scalar_roughness = lru_cache(maxsize=1024)(self._interp)
+
+    def _interp(self, stage):
+
+        stage = np.clip(stage, self._stage[0], self._stage[-1])
+
+        idx = np.searchsorted(self._stage, stage) - 1
+        idx = np.clip(idx, 0, self._slope.size - 1)
+
+        return self._roughness[idx] + \
+            self._slope[idx] * (stage - self._stage[idx])
+
     def plot(self, ax=None):
 
         if ax is None:
@@ -79,4 +118,7 @@ class TableFrict(Frict):
 
         """
 
-        return np.interp(stage, self._stage, self._roughness)
+        if isinstance(stage, float):
+            return self._scalar_roughness(stage)
+
+        return self._interp(stage)
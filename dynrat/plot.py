@@ -1,7 +1,7 @@
 from matplotlib.collections import LineCollection
 import matplotlib.pyplot as plt
-from matplotlib.ticker import AutoMinorLocator
 import numpy as np
+import pandas as pd
 
 from dynrat.timeseries import ContinuousTimeSeries, TimeSeries
 
@@ -12,13 +12,30 @@ def _color_scale(time_as_float, t_min, t_max, periods):
     period_range = time_range / periods
     scaled_times = (time_as_float - t_min) / period_range
 
-    while np.any(scaled_times > 1):
-        gt_one = scaled_times > 1
-        scaled_times[gt_one] -= 1
+    # wrap values greater than one into (0, 1] in a single pass;
+    # unlike np.mod, whole periods map to one rather than zero
+    scaled_times = scaled_times - \
+        np.clip(np.ceil(scaled_times - 1.), 0., None)
 
     return scaled_times
 
 
+def _line_segments(x, y):
+    """Builds a LineCollection segment array from x/y values.
+
+    Fills a preallocated (N-1, 2, 2) array directly instead of
+    stacking the points and concatenating shifted copies.
+    """
+
+    segments = np.empty((len(x) - 1, 2, 2))
+    segments[:, 0, 0] = x[:-1]
+    segments[:, 0, 1] = y[:-1]
+    segments[:, 1, 0] = x[1:]
+    segments[:, 1, 1] = y[1:]
+
+    return segments
+
+
 def _plot_obs_q_data(obs_data, t_min, t_max, ax1, ax2, cmap, norm, periods):
 
     obs_flow_data = obs_data[1].data()
@@ -68,14 +85,15 @@ def multicolor_h_vs_q(stage, discharge, obs_data=None, fig=None,
     ax1 = plt.subplot2grid((4, 1), (0, 0), colspan=1, rowspan=1, fig=fig)
     ax2 = plt.subplot2grid((4, 1), (1, 0), colspan=1, rowspan=3, fig=fig)
 
-    h_series = stage.data()
-    q_series = discharge.data()
+    # align the two series in a single pass instead of an index
+    # intersection followed by label-based lookups
+    hq = pd.concat([stage.data().rename('h'),
+                    discharge.data().rename('q')],
+                   axis=1, join='inner')
 
-    inter_idx = h_series.index.intersection(q_series.index)
-
-    q_values = q_series[inter_idx].values
-    h_values = h_series[inter_idx].values
-    time_as_float = inter_idx.values.astype(float)
+    q_values = hq['q'].to_numpy()
+    h_values = hq['h'].to_numpy()
+    time_as_float = hq.index.values.astype(float)
     t_min = time_as_float.min()
     t_max = time_as_float.max()
     time_range = t_max - t_min
@@ -86,16 +104,14 @@ def multicolor_h_vs_q(stage, discharge, obs_data=None, fig=None,
     norm = plt.Normalize(0, 1)
 
     # discharge vs time hydrograph
-    q_t_points = np.array([norm_time_as_float, q_values]).T.reshape(-1, 1, 2)
-    q_t_segments = np.concatenate([q_t_points[:-1], q_t_points[1:]], axis=1)
+    q_t_segments = _line_segments(norm_time_as_float, q_values)
     q_t_lc = LineCollection(q_t_segments, cmap=colormap, norm=norm)
     q_t_lc.set_array(scaled_times)
     q_t_lc.set_linewidth(2)
     ax1.add_collection(q_t_lc)
 
     # stage vs discharge plot
-    h_q_points = np.array([q_values, h_values]).T.reshape(-1, 1, 2)
-    h_q_segments = np.concatenate([h_q_points[:-1], h_q_points[1:]], axis=1)
+    h_q_segments = _line_segments(q_values, h_values)
     h_q_lc = LineCollection(h_q_segments, cmap=colormap, norm=norm)
     h_q_lc.set_array(scaled_times)
     h_q_lc.set_linewidth(2)
@@ -147,14 +163,15 @@ def multicolor_q_vs_h(stage, discharge, obs_data=None, fig=None,
     ax1 = plt.subplot2grid((4, 1), (0, 0), colspan=1, rowspan=1, fig=fig)
     ax2 = plt.subplot2grid((4, 1), (1, 0), colspan=1, rowspan=3, fig=fig)
 
-    h_series = stage.data()
-    q_series = discharge.data()
-
-    inter_idx = h_series.index.intersection(q_series.index)
+    # align the two series in a single pass instead of an index
+    # intersection followed by label-based lookups
+    hq = pd.concat([stage.data().rename('h'),
+                    discharge.data().rename('q')],
+                   axis=1, join='inner')
 
-    q_values = q_series[inter_idx].values
-    h_values = h_series[inter_idx].values
-    time_as_float = inter_idx.values.astype(float)
+    q_values = hq['q'].to_numpy()
+    h_values = hq['h'].to_numpy()
+    time_as_float = hq.index.values.astype(float)
     t_min = time_as_float.min()
     t_max = time_as_float.max()
     time_range = t_max - t_min
@@ -165,16 +182,14 @@ def multicolor_q_vs_h(stage, discharge, obs_data=None, fig=None,
     norm = plt.Normalize(0, 1)
 
     # stage vs time hydrograph
-    h_t_points = np.array([norm_time_as_float, h_values]).T.reshape(-1, 1, 2)
-    h_t_segments = np.concatenate([h_t_points[:-1], h_t_points[1:]], axis=1)
+    h_t_segments = _line_segments(norm_time_as_float, h_values)
     h_t_lc = LineCollection(h_t_segments, cmap=colormap, norm=norm)
     h_t_lc.set_array(scaled_times)
     h_t_lc.set_linewidth(2)
     ax1.add_collection(h_t_lc)
 
     # stage vs discharge plot
-    h_q_points = np.array([q_values, h_values]).T.reshape(-1, 1, 2)
-    h_q_segments = np.concatenate([h_q_points[:-1], h_q_points[1:]], axis=1)
+    h_q_segments = _line_segments(q_values, h_values)
     h_q_lc = LineCollection(h_q_segments, cmap=colormap, norm=norm)
     h_q_lc.set_array(scaled_times)
     h_q_lc.set_linewidth(2)
@@ -262,11 +277,45 @@ def stage_discharge_plot(stage, discharge, ax=None, color=None, label=None):
         h_series = stage.data()
         q_series = discharge.data()
 
-        inter_idx = h_series.index.intersection(q_series.index)
+        h_index = h_series.index
+        q_index = q_series.index
+
+        if h_index.is_monotonic_increasing and \
+                q_index.is_monotonic_increasing:
+
+            h_times = h_index.values
+            q_times = q_index.values
+
+            # gauge series arrive sorted, so a linear merge of the
+            # two indexes beats the hash-based intersection that a
+            # join would run
+            inter_idx = np.intersect1d(h_times, q_times,
+                                       assume_unique=True)
+
+            # positional lookup on the underlying arrays; every
+            # intersection value is present in both indexes, so
+            # searchsorted lands on exact matches
+            h_pos = np.searchsorted(h_times, inter_idx)
+            q_pos = np.searchsorted(q_times, inter_idx)
+
+            h_values = h_series.to_numpy()[h_pos]
+            q_values = q_series.to_numpy()[q_pos]
+
+        else:
+
+            hq = pd.concat([h_series.rename('h'),
+                            q_series.rename('q')],
+                           axis=1, join='inner')
+
+            h_values = hq['h'].to_numpy()
+            q_values = hq['q'].to_numpy()
 
-        ax.plot(q_series[inter_idx].values, h_series[inter_idx].values,
+        # rasterizing long series keeps saved vector figures small
+        # and fast to render while axes and labels stay vector
+        ax.plot(q_values, h_values,
                 label=label, linestyle='solid',
-                color=color)
+                color=color,
+                rasterized=h_values.size > 5000)
 
     elif isinstance(stage, TimeSeries) and isinstance(discharge, TimeSeries):
 
@@ -276,8 +325,17 @@ def stage_discharge_plot(stage, discharge, ax=None, color=None, label=None):
         if label is None:
             label = 'Observed Discrete Discharge'
 
-        ax.scatter(discharge.values(), stage.values(),
-                   label=label, color=color)
+        # single calls into the time series accessors; values()
+        # builds a fresh array each time
+        q_values = discharge.values()
+        h_values = stage.values()
+
+        # single-color markers through the Line2D renderer avoid
+        # the per-point arrays a scatter PathCollection builds
+        ax.plot(q_values, h_values,
+                marker='o', linestyle='None',
+                label=label, color=color,
+                rasterized=len(q_values) > 5000)
 
     else:
         raise TypeError("Unrecognized types of time series")
@@ -11,6 +11,38 @@ References
 
 import numpy as np
 
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+def _make_r_slope_vec():
+    """Builds the vectorized kernel used by :func:`r_slope_vec`.
+
+    When Numba is available, the kernel is compiled in nopython
+    mode and cached on disk.
+
+    """
+
+    def r_slope_vec_kernel(h_o, h_p, q_o, q_p, s_o, stage_tbl,
+                           area_tbl, t_diff):
+
+        h_mean = (h_o + h_p)/2
+
+        a_mean = np.interp(h_mean, stage_tbl, area_tbl)
+
+        return 56200*(q_p + q_o)*t_diff*s_o/((h_p - h_o)*a_mean)
+
+    if _HAVE_NUMBA:
+        r_slope_vec_kernel = njit(cache=True, nogil=True)(r_slope_vec_kernel)
+
+    return r_slope_vec_kernel
+
+
+_r_slope_vec = _make_r_slope_vec()
+
 
 def r_slope(h_o, h_p, q_o, q_p, s_o, sect, t_diff):
     """Computes the ratio of channel bed slope to an average wave slope
@@ -54,3 +86,58 @@ def r_slope(h_o, h_p, q_o, q_p, s_o, sect, t_diff):
     r2 = r1*t_diff*s_o
 
     return r2
+
+
+def r_slope_vec(h_o, h_p, q_o, q_p, s_o, sect, t_diff):
+    """Computes the slope ratio for a series of flood events
+
+    Vectorized form of :func:`r_slope`. The mean-stage areas are
+    interpolated directly on the breakpoint arrays of a
+    table-backed cross section, so the whole series is computed in
+    one compiled (or single NumPy) call.
+
+    Parameters
+    ----------
+    h_o: array_like
+        Stage at beginning of each flood, in ft
+    h_p: array_like
+        Peak stage of each flood, in ft
+    q_o: array_like
+        Discharge at beginning of each flood, in cfs
+    q_p: array_like
+        Peak discharge for each flood, in cfs
+    s_o: float
+        Bed slope
+    sect: TableSect or CrossSect
+        Channel cross section
+    t_diff: array_like
+        Interval of time from beginning of rise in stage until the
+        occurrence of peak stage, in days
+
+    Returns
+    -------
+    numpy.ndarray
+        Ratio of channel bed slope to an average wave slope
+
+    """
+
+    # CrossSect wraps a TableSect in its _sect attribute
+    table = getattr(sect, '_sect', sect)
+
+    try:
+        stage_tbl = table._stage
+        area_tbl = table._area
+    except AttributeError:
+        raise RuntimeError(
+            "Cross section must be table-backed to compute slope "
+            + "ratios on breakpoint arrays")
+
+    return _r_slope_vec(
+        np.ascontiguousarray(h_o, dtype=np.float64),
+        np.ascontiguousarray(h_p, dtype=np.float64),
+        np.ascontiguousarray(q_o, dtype=np.float64),
+        np.ascontiguousarray(q_p, dtype=np.float64),
+        float(s_o),
+        np.ascontiguousarray(stage_tbl, dtype=np.float64),
+        np.ascontiguousarray(area_tbl, dtype=np.float64),
+        np.ascontiguousarray(t_diff, dtype=np.float64))
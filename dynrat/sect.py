@@ -1,4 +1,6 @@
 from abc import abstractmethod
+from collections import namedtuple
+from math import isfinite
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -8,9 +10,64 @@ from hydxscomp.crosssection import CrossSection as AnchovyXS
 import dynrat
 from dynrat.frict import TableFrict
 
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
 logger = dynrat.logger.getChild(__name__)
 
 
+def _make_interp_uniform():
+    """Builds the scalar kernel used by :class:`UniformTableSect`.
+
+    When Numba is available, the kernel is compiled in nopython
+    mode and cached on disk, collapsing a lookup to a handful of
+    machine instructions.
+
+    """
+
+    def interp_uniform(stage, grid_min, inv_dx, n, values):
+
+        # non-finite stages yield NaN, as np.interp and the fused
+        # properties lookup do; the index computation below would
+        # cast NaN to a garbage index instead
+        if not isfinite(stage):
+            return np.nan
+
+        u = (stage - grid_min)*inv_dx
+        if u < 0:
+            u = 0.
+        elif u > n - 1:
+            u = n - 1.
+        i = int(u)
+        if i > n - 2:
+            i = n - 2
+        t = u - i
+
+        return values[i] + t*(values[i + 1] - values[i])
+
+    # the full fastmath flag set assumes no NaNs and would fold the
+    # finite check away; keep the reassociation-style flags and drop
+    # nnan/ninf
+    if _HAVE_NUMBA:
+        interp_uniform = njit(
+            cache=True, nogil=True,
+            fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'},
+        )(interp_uniform)
+
+    return interp_uniform
+
+
+_interp_uniform = _make_interp_uniform()
+
+
+SectProps = namedtuple('SectProps', ['area', 'conveyance', 'top_width',
+                                     'vel_dist_factor',
+                                     'wetted_perimeter'])
+
+
 class Sect:
     """Interface for cross section properties
 
@@ -44,11 +101,16 @@ class TableSect(Sect):
 
     Parameters
     ----------
+    dtype : numpy.dtype, optional
+        Storage dtype of the property arrays (the default is
+        ``numpy.float64``). Passing ``numpy.float32`` halves the
+        cache footprint of long tables when full precision isn't
+        needed.
     kwargs : dict
 
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, dtype=np.float64, **kwargs):
 
         self._methods = []
 
@@ -59,7 +121,7 @@ class TableSect(Sect):
         if stage is None:
             raise RuntimeError("stage must be passed as a kwarg")
 
-        self._stage = np.array(stage)
+        self._stage = np.array(stage, dtype=dtype)
 
         if self._stage.ndim != 1:
             raise ValueError("stage must be one-dimensional")
@@ -67,11 +129,18 @@ class TableSect(Sect):
         if self._stage.size < 2:
             raise ValueError("stage must at least have two elements")
 
-        if not np.alltrue(np.diff(stage) >= 0):
+        # shifted comparison avoids the diff allocation and the
+        # deprecated np.alltrue
+        if not (self._stage[:-1] <= self._stage[1:]).all():
             raise ValueError("stage must be sorted in ascending order")
 
+        # bracketing index of the most recent scalar lookup; stages
+        # passed by the solvers move nearly monotonically, so the
+        # bracket rarely changes between calls
+        self._last_i = 0
+
         for k, v in kwargs.items():
-            v_array = np.array(v)
+            v_array = np.array(v, dtype=dtype)
 
             if v_array.ndim != 1:
                 raise ValueError("{} must be one-dimensional".format(k))
@@ -84,26 +153,127 @@ class TableSect(Sect):
             setattr(self, '_' + k, v_array)
             self._methods.append(k)
 
-    def __getattribute__(self, name):
+            # bind the interpolating method once per property
+            # instead of dispatching through __getattribute__ and
+            # allocating a closure on every access
+            setattr(self, k, self._interp_method(v_array))
 
-        methods = super().__getattribute__('_methods')
+    def __getstate__(self):
 
-        if name in methods:
+        # the bound interpolating closures aren't picklable; drop
+        # them and rebuild on unpickling
+        state = self.__dict__.copy()
+        for name in self._methods:
+            del state[name]
 
-            return lambda stage: self._interp(name, stage)
+        return state
 
-        else:
+    def __setstate__(self, state):
 
-            return super().__getattribute__(name)
+        self.__dict__.update(state)
+        for name in self._methods:
+            setattr(self, name,
+                    self._interp_method(getattr(self, '_' + name)))
+
+    def _bracket(self, s):
+        """Finds the index of the segment containing a stage.
+
+        Tries the segment found by the previous call (and its
+        neighbors) before falling back to a binary search, making
+        lookups O(1) amortized for the near-monotone stage
+        sequences the solvers produce.
+        """
+
+        stage = self._stage
+        i = self._last_i
+
+        if not stage[i] <= s <= stage[i + 1]:
+            if i > 0 and stage[i - 1] <= s <= stage[i]:
+                i -= 1
+            elif i < stage.size - 2 and stage[i + 1] <= s <= stage[i + 2]:
+                i += 1
+            else:
+                i = int(np.clip(np.searchsorted(stage, s) - 1,
+                                0, stage.size - 2))
+            self._last_i = i
+
+        return i
+
+    def _interp_method(self, values):
+
+        stage = self._stage
 
-    def _interp(self, name, stage):
+        # per-segment slopes computed once at construction; a
+        # lookup is then a subtract and a multiply-add instead of
+        # a division per call
+        d_stage = np.diff(stage)
+        slopes = np.diff(values)/np.where(d_stage > 0, d_stage, 1.)
+
+        def interp(s):
+
+            if np.ndim(s):
+                return np.interp(s, stage, values)
+
+            i = self._bracket(s)
+
+            s0 = stage[i]
+
+            if s <= s0:
+                return values[i]
+            if s >= stage[i + 1]:
+                return values[i + 1]
+
+            return values[i] + (s - s0)*slopes[i]
+
+        return interp
+
+    def _interp_and_derivative(self, name, stage):
 
         attr = getattr(self, '_' + name)
 
-        self.logger.debug(
-            "Interpolating {} at stage {}".format('_' + name, stage))
+        value = np.interp(stage, self._stage, attr)
+
+        # slope of the bracketing segment; one table lookup serves
+        # both the value and the derivative
+        idx = np.clip(np.searchsorted(self._stage, stage) - 1,
+                      0, self._stage.size - 2)
+        d_stage = self._stage[idx + 1] - self._stage[idx]
+        derivative = np.where(d_stage > 0,
+                              (attr[idx + 1] - attr[idx]) /
+                              np.where(d_stage > 0, d_stage, 1.),
+                              0.)
 
-        return np.interp(stage, self._stage, attr)
+        return value, derivative
+
+    def area_and_derivative(self, stage):
+        """Returns area and its derivative with respect to stage
+
+        Parameters
+        ----------
+        stage : float
+
+        Returns
+        -------
+        tuple of float
+
+        """
+
+        return self._interp_and_derivative('area', stage)
+
+    def conveyance_and_derivative(self, stage):
+        """Returns conveyance and its derivative with respect to stage
+
+        Parameters
+        ----------
+        stage : float
+
+        Returns
+        -------
+        tuple of float
+
+        """
+
+        return self._interp_and_derivative('conveyance', stage)
 
     def to_csv(self, csv_path):
         """Write this table to a CSV file
@@ -129,6 +299,58 @@ class TableSect(Sect):
         np.savetxt(csv_path, X, delimiter=',', header=header)
 
 
+class UniformTableSect(TableSect):
+    """Cross section properties from a table on a uniform stage grid
+
+    Behaves like :class:`TableSect`, but exploits the regular
+    spacing of the stage grid to compute the bracketing index
+    directly instead of running the binary search inside
+    ``np.interp``. ``stage`` must be uniformly spaced and
+    increasing.
+
+    Parameters
+    ----------
+    kwargs : dict
+
+    """
+
+    def __init__(self, **kwargs):
+
+        stage = np.asarray(kwargs.get('stage'), dtype=np.float64)
+
+        d_stage = np.diff(stage)
+        if not np.allclose(d_stage, d_stage[0]):
+            raise ValueError("stage must be uniformly spaced")
+
+        super().__init__(**kwargs)
+
+    def _interp_method(self, values):
+
+        values = np.ascontiguousarray(values)
+
+        grid_min = float(self._stage[0])
+        n = self._stage.size
+        inv_dx = (n - 1)/(float(self._stage[-1]) - grid_min)
+
+        def interp(s):
+
+            if np.ndim(s):
+                s = np.asarray(s)
+                finite = np.isfinite(s)
+                u = np.clip(
+                    (np.where(finite, s, grid_min) - grid_min)*inv_dx,
+                    0., n - 1.)
+                i = np.minimum(u.astype(np.intp), n - 2)
+                t = u - i
+                out = values[i] + t*(values[i + 1] - values[i])
+                out[~finite] = np.nan
+                return out
+
+            return _interp_uniform(s, grid_min, inv_dx, n, values)
+
+        return interp
+
+
 class CrossSect(Sect):
     """Cross section
 
@@ -168,10 +390,24 @@ class CrossSect(Sect):
                   'vel_dist_factor': xs.vel_dist_factor(e),
                   'wetted_perimeter': xs.wetted_perimeter(e)}
 
-        self._sect = TableSect(**kwargs)
+        # the grid is uniform by construction, so the table variant
+        # with direct index computation applies
+        self._sect = UniformTableSect(**kwargs)
 
-    def area(self, stage):
-        """Computes area of this cross section
+        # one row of this stack holds every property at a grid
+        # stage, so a fused lookup traverses a single cache line
+        # instead of five separate arrays
+        self._props = np.stack(
+            [np.asarray(kwargs[name], dtype=np.float64)
+             for name in SectProps._fields], axis=1)
+        self._inv_dx = (num - 1)/(self._e_max - self._e_min)
+
+    def properties(self, stage):
+        """Computes all tabulated properties at a stage in one lookup
+
+        Interpolates area, conveyance, top width, the velocity
+        distribution factor, and wetted perimeter with a single
+        bracket computation.
 
         Parameters
         ----------
@@ -179,41 +415,167 @@ class CrossSect(Sect):
 
         Returns
         -------
-        float
+        SectProps
 
         """
 
-        if not np.isfinite(stage):
-            self.logger.warning("Non-finite stage passed to area method")
+        if not self._in_range(stage, 'properties'):
+            return SectProps(self._xs.area(stage),
+                             self._xs.conveyance(stage),
+                             self._xs.top_width(stage),
+                             self._xs.vel_dist_factor(stage),
+                             self._xs.wetted_perimeter(stage))
+
+        if not isfinite(stage):
+            return SectProps(np.nan, np.nan, np.nan, np.nan, np.nan)
+
+        n = self._props.shape[0]
+
+        u = (stage - self._e_min)*self._inv_dx
+        if u < 0:
+            u = 0.
+        elif u > n - 1:
+            u = n - 1.
+        i = int(u)
+        if i > n - 2:
+            i = n - 2
+        t = u - i
+
+        row = self._props[i] + t*(self._props[i + 1] - self._props[i])
+
+        return SectProps(*row)
+
+    def _in_range(self, stage, name):
+        """Checks a stage against the tabulated range.
+
+        Returns True when the tabulated properties apply. The happy
+        path is a single chained comparison; the warnings use lazy
+        %-style formatting so nothing is built unless a message is
+        emitted.
+        """
 
-        if stage < self._e_min or self._e_max < stage:
+        if self._e_min <= stage <= self._e_max:
+            return True
+
+        if not isfinite(stage):
+            self.logger.warning(
+                "Non-finite stage passed to %s method", name)
+            return True
+
+        self.logger.warning(
+            "Stage %s is outside of the range of this cross section",
+            stage)
+
+        return False
+
+    def _array_property(self, stage, table_method, xs_method, name):
+        """Evaluates a property for an array of stages.
+
+        In-range stages go through the tabulated interpolant in one
+        vectorized call. Out-of-range stages are delegated to the
+        wrapped cross section per value, and non-finite stages map
+        to NaN.
+        """
+
+        stage = np.asarray(stage, dtype=np.float64)
+
+        finite = np.isfinite(stage)
+        values = table_method(np.where(finite, stage, self._e_min))
+        values[~finite] = np.nan
+
+        out = finite & ((stage < self._e_min) | (stage > self._e_max))
+        if out.any():
             self.logger.warning(
-                "Stage {} is outside of ".format(stage) +
-                "the range of this cross section")
+                "%s stages passed to %s method are outside of the "
+                "range of this cross section", int(out.sum()), name)
+            out_stages = stage[out]
+            values[out] = np.fromiter(
+                (xs_method(s) for s in out_stages),
+                dtype=np.float64, count=out_stages.size)
+
+        return values
+
+    def area(self, stage):
+        """Computes area of this cross section
+
+        Parameters
+        ----------
+        stage : float or array_like
+
+        Returns
+        -------
+        float or numpy.ndarray
+
+        """
+
+        if np.ndim(stage):
+            return self._array_property(stage, self._sect.area,
+                                        self._xs.area, 'area')
+
+        if not self._in_range(stage, 'area'):
             return self._xs.area(stage)
 
         return self._sect.area(stage)
 
     def conveyance(self, stage):
 
-        if not np.isfinite(stage):
-            self.logger.warning("Non-finite stage passed to conveyance method")
+        if np.ndim(stage):
+            return self._array_property(stage, self._sect.conveyance,
+                                        self._xs.conveyance, 'conveyance')
 
-        if stage < self._e_min or self._e_max < stage:
-            self.logger.warning(
-                "Stage {} is outside of ".format(stage) +
-                "the range of this cross section")
+        if not self._in_range(stage, 'conveyance'):
             return self._xs.conveyance(stage)
 
         return self._sect.conveyance(stage)
 
+    def area_and_derivative(self, stage):
+        """Computes area and its derivative with respect to stage
+
+        Parameters
+        ----------
+        stage : float
+
+        Returns
+        -------
+        tuple of float
+
+        """
+
+        return self._sect.area_and_derivative(stage)
+
+    def conveyance_and_derivative(self, stage):
+        """Computes conveyance and its derivative with respect to
+        stage
+
+        Parameters
+        ----------
+        stage : float
+
+        Returns
+        -------
+        tuple of float
+
+        """
+
+        return self._sect.conveyance_and_derivative(stage)
+
     @classmethod
     def from_csv(cls, csv_path):
 
         logger.debug("Initializing {} from {}".format(cls.__name__, csv_path))
 
-        station, elevation = np.loadtxt(
-            csv_path, delimiter=',', skiprows=1, unpack=True)
+        try:
+            # the C tokenizer in pandas parses large coordinate
+            # files much faster than the row-by-row loadtxt loop
+            import pandas as pd
+
+            coordinates = pd.read_csv(
+                csv_path, header=0, dtype=np.float64).to_numpy()
+            station = coordinates[:, 0]
+            elevation = coordinates[:, 1]
+        except ImportError:
+            station, elevation = np.loadtxt(
+                csv_path, delimiter=',', skiprows=1, unpack=True)
 
         # roughness isn't used here
         xs = AnchovyXS(station, elevation, 0.035, wall=True)
@@ -257,49 +619,43 @@ class CrossSect(Sect):
 
         Parameters
         ----------
-        stage : float
+        stage : float or array_like
 
         Returns
         -------
-        float
+        float or numpy.ndarray
 
         """
 
-        if not np.isfinite(stage):
-            self.logger.warning("Non-finite stage passed to top width method")
+        if np.ndim(stage):
+            return self._array_property(stage, self._sect.top_width,
+                                        self._xs.top_width, 'top_width')
 
-        if stage < self._e_min or self._e_max < stage:
-            self.logger.warning(
-                "Stage {} is outside of ".format(stage) +
-                "the range of this cross section")
+        if not self._in_range(stage, 'top_width'):
             return self._xs.top_width(stage)
 
         return self._sect.top_width(stage)
 
     def vel_dist_factor(self, stage):
 
-        if not np.isfinite(stage):
-            self.logger.warning(
-                "Non-finite stage passed to vel_dist_factor method")
+        if np.ndim(stage):
+            return self._array_property(
+                stage, self._sect.vel_dist_factor,
+                self._xs.vel_dist_factor, 'vel_dist_factor')
 
-        if stage < self._e_min or self._e_max < stage:
-            self.logger.warning(
-                "Stage {} is outside of ".format(stage) +
-                "the range of this cross section")
+        if not self._in_range(stage, 'vel_dist_factor'):
             return self._xs.vel_dist_factor(stage)
 
         return self._sect.vel_dist_factor(stage)
 
     def wetted_perimeter(self, stage):
 
-        if not np.isfinite(stage):
-            self.logger.warning(
-                "Non-finite stage passed to wetted_perimeter method")
+        if np.ndim(stage):
+            return self._array_property(
+                stage, self._sect.wetted_perimeter,
+                self._xs.wetted_perimeter, 'wetted_perimeter')
 
-        if stage < self._e_min or self._e_max < stage:
-            self.logger.warning(
-                "Stage {} is outside of ".format(stage) +
-                "the range of this cross section")
+        if not self._in_range(stage, 'wetted_perimeter'):
             return self._xs.wetted_perimeter(stage)
 
         return self._sect.wetted_perimeter(stage)
@@ -1,19 +1,83 @@
+import concurrent.futures
+import logging
+from math import isnan
+
 import numpy as np
 import pandas as pd
 
 import dynrat
-from dynrat.timeseries import ComputedDischargeTimeSeries, ComputedStageTimeSeries
+from dynrat.timeseries import (ComputedDischargeTimeSeries,
+                               ComputedStageTimeSeries)
 
 
 # module-level logger
 logger = dynrat.logger.getChild(__name__)
 
 
+def _solve_recurrence(x, x0, y0, step_solve, log_error, log_debug,
+                      debug_enabled, timestamps):
+    """Runs the scalar per-step recurrence shared by both front ends.
+
+    Every step is the same call shape — solve this step's unknown
+    from this step's known value and the prior step's pair — so the
+    first step folds into the loop with the initial conditions as
+    the prior pair. Values from the first failed step onward stay
+    NaN.
+    """
+
+    # every slot up to the first failure is written by the loop, so
+    # an uninitialized buffer plus one tail fill beats initializing
+    # the whole array to NaN up front
+    y = np.empty(x.shape, dtype=np.float64)
+
+    x_prev = x0
+    y_prev = y0
+    n_steps = len(x)
+    stop = n_steps
+
+    # one exception frame around the whole recurrence; the loop
+    # itself carries no per-step exception setup, and a failed step
+    # leaves this and every later value NaN either way
+    try:
+        for i in range(n_steps):
+
+            y[i] = step_solve(x[i], x_prev, y_prev)
+
+            # scalar C-level predicate; the ufunc equivalents
+            # dispatch on a 0-d array each step, and y is real by
+            # construction so the complex check is gone
+            if isnan(y[i]):
+                log_error("NaN encountered at index %s, timestamp %s",
+                          i + 1, timestamps[i + 1])
+                stop = i
+                break
+            elif debug_enabled:
+                log_debug("Computed %s for timestamp %s",
+                          y[i], timestamps[i + 1])
+
+            x_prev = x[i]
+            y_prev = y[i]
+    except RuntimeError:
+        log_error("NaN encountered at index %s, timestamp %s",
+                  i + 1, timestamps[i + 1])
+        stop = i
+
+    y[stop:] = np.nan
+
+    return y
+
+
 class HTimeSeries:
 
     def __init__(self, solver):
 
         self._solver = solver
+
+        # detect the compiled recurrence once; solve_ts dispatches
+        # on the cached attribute instead of a hasattr check per call
+        self._h_solve_recurrence = getattr(solver, 'h_solve_recurrence',
+                                           None)
+
         self.logger = logger.getChild(self.__class__.__name__)
 
     def solve_ts(self, discharge_time_series, h0):
@@ -34,47 +98,78 @@ class HTimeSeries:
 
         discharge_series = discharge_time_series.data()
 
-        q = discharge_series.values[1:]
-        q0 = discharge_series.values[0]
-
-        h = np.nan * np.empty_like(q)
+        # normalize the layout once so the compiled recurrence
+        # always sees a contiguous float64 buffer; a no-op when the
+        # series already stores one
+        q = np.ascontiguousarray(discharge_series.values[1:],
+                                 dtype=np.float64)
+        q0 = float(discharge_series.values[0])
+
+        # solvers with table-backed sections can run the whole
+        # recurrence in one compiled call instead of a Python loop
+        if self._h_solve_recurrence is not None:
+            # the interpreted kernel raises ZeroDivisionError where
+            # the compiled one yields inf; both fall back here
+            try:
+                h = self._h_solve_recurrence(q, q0, h0)
+            except (RuntimeError, ZeroDivisionError):
+                h = None
+            if h is not None:
+                nan_idx = np.nonzero(np.isnan(h))[0]
+                if nan_idx.size:
+                    self.logger.error(
+                        "NaN encountered at index %s, timestamp %s",
+                        nan_idx[0] + 1,
+                        discharge_series.index[nan_idx[0] + 1])
+                h_series = pd.Series(index=discharge_series.index[1:],
+                                     data=h)
+                return ComputedStageTimeSeries(h_series)
+
+        # index the plain timestamp array inside the loop; pulling
+        # labels out of the DatetimeIndex each step is costly
+        timestamps = discharge_series.index.to_numpy(copy=False)
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+        h = _solve_recurrence(q, q0, h0, self._solver.h_solve,
+                              self.logger.error, self.logger.debug,
+                              debug_enabled, timestamps)
 
-        try:
-            h[0] = self._solver.h_solve(q[0], q0, h0)
-        except RuntimeError:
-            h[0] = np.nan
-            self.logger.error("NaN encountered at index " +
-                              "{}, timestamp {}".format(1,
-                                                        discharge_series.index[1]))
+        h_series = pd.Series(index=discharge_series.index[1:], data=h)
 
-            h_series = pd.Series(index=discharge_series.index[1:], data=h)
+        return ComputedStageTimeSeries(h_series)
 
-            return ComputedStageTimeSeries(h_series)
+    def solve_many(self, discharge_time_series_list, h0_list, n_jobs=None):
+        """Solves several independent discharge time series
 
-        for i in range(1, len(q)):
+        Each series is an independent sequential recurrence, so the
+        solves fan out across worker processes; within a single
+        series the recurrence stays sequential.
 
-            try:
-                h[i] = self._solver.h_solve(q[i], q[i - 1], h[i - 1])
-            except RuntimeError:
-                h[i] = np.nan
+        Parameters
+        ----------
+        discharge_time_series_list : list of TimeSeries
+            Discharge time series
+        h0_list : list of float
+            Starting stage values, one per series
+        n_jobs : {int, None}, optional
+            Number of worker processes (the default is None, which
+            uses one per processor). 1 solves serially in this
+            process.
 
-            dt_step = discharge_series.index[i+1]
+        Returns
+        -------
+        list of ComputedStageTimeSeries
 
-            if np.isnan(h[i]):
-                self.logger.error("NaN encountered at index " +
-                                  "{}, timestamp {}".format(i+1, dt_step))
-                break
-            if np.iscomplex(h[i]):
-                self.logger.error("Complex value encountered at index " +
-                                  "{}, timestamp {}".format(i+1, dt_step))
-                break
-            else:
-                self.logger.debug(
-                    "Computed {} for timestamp {}".format(h[i], dt_step))
+        """
 
-        h_series = pd.Series(index=discharge_series.index[1:], data=h)
+        if n_jobs == 1:
+            return [self.solve_ts(ts, h0)
+                    for ts, h0 in zip(discharge_time_series_list, h0_list)]
 
-        return ComputedStageTimeSeries(h_series)
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=n_jobs) as executor:
+            return list(executor.map(
+                self.solve_ts, discharge_time_series_list, h0_list))
 
 
 class QTimeSeries:
@@ -82,6 +177,12 @@ class QTimeSeries:
     def __init__(self, solver):
 
         self._solver = solver
+
+        # detect the compiled recurrence once; solve_ts dispatches
+        # on the cached attribute instead of a hasattr check per call
+        self._q_solve_recurrence = getattr(solver, 'q_solve_recurrence',
+                                           None)
+
         self.logger = logger.getChild(self.__class__.__name__)
 
     def solve_ts(self, stage_time_series, q0):
@@ -102,44 +203,74 @@ class QTimeSeries:
 
         stage_series = stage_time_series.data()
 
-        h = stage_series.values[1:]
-        h0 = stage_series.values[0]
-
-        q = np.nan * np.empty_like(h)
+        # normalize the layout once so the compiled recurrence
+        # always sees a contiguous float64 buffer; a no-op when the
+        # series already stores one
+        h = np.ascontiguousarray(stage_series.values[1:],
+                                 dtype=np.float64)
+        h0 = float(stage_series.values[0])
+
+        # solvers with table-backed sections can run the whole
+        # recurrence in one compiled call instead of a Python loop
+        if self._q_solve_recurrence is not None:
+            # the interpreted kernel raises ZeroDivisionError where
+            # the compiled one yields inf; both fall back here
+            try:
+                q = self._q_solve_recurrence(h, h0, q0)
+            except (RuntimeError, ZeroDivisionError):
+                q = None
+            if q is not None:
+                nan_idx = np.nonzero(np.isnan(q))[0]
+                if nan_idx.size:
+                    self.logger.error(
+                        "NaN encountered at index %s, timestamp %s",
+                        nan_idx[0] + 1,
+                        stage_series.index[nan_idx[0] + 1])
+                q_series = pd.Series(index=stage_series.index[1:], data=q)
+                return ComputedDischargeTimeSeries(q_series)
+
+        # index the plain timestamp array inside the loop; pulling
+        # labels out of the DatetimeIndex each step is costly
+        timestamps = stage_series.index.to_numpy(copy=False)
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+        q = _solve_recurrence(h, h0, q0, self._solver.q_solve,
+                              self.logger.error, self.logger.debug,
+                              debug_enabled, timestamps)
 
-        try:
-            q[0] = self._solver.q_solve(h[0], h0, q0)
-        except RuntimeError:
-            q[0] = np.nan
-            self.logger.error("NaN encountered at index " +
-                              "{}, timestamp {}".format(1,
-                                                        stage_series.index[1]))
+        q_series = pd.Series(index=stage_series.index[1:], data=q)
 
-            q_series = pd.Series(index=stage_series.index[1:], data=q)
+        return ComputedDischargeTimeSeries(q_series)
 
-            return ComputedDischargeTimeSeries(q_series)
+    def solve_many(self, stage_time_series_list, q0_list, n_jobs=None):
+        """Solves several independent stage time series
 
-        for i in range(1, len(h)):
+        Each series is an independent sequential recurrence, so the
+        solves fan out across worker processes; within a single
+        series the recurrence stays sequential.
 
-            try:
-                q[i] = self._solver.q_solve(h[i], h[i - 1], q[i - 1])
-            except RuntimeError:
-                q[i] = np.nan
+        Parameters
+        ----------
+        stage_time_series_list : list of MeasuredStageTimeSeries
+            Stage time series
+        q0_list : list of float
+            Starting discharge values, one per series
+        n_jobs : {int, None}, optional
+            Number of worker processes (the default is None, which
+            uses one per processor). 1 solves serially in this
+            process.
 
-            dt_step = stage_series.index[i+1]
+        Returns
+        -------
+        list of ComputedDischargeTimeSeries
 
-            if np.isnan(q[i]):
-                self.logger.error("NaN encountered at index " +
-                                  "{}, timestamp {}".format(i+1, dt_step))
-                break
-            if np.iscomplex(q[i]):
-                self.logger.error("Complex value encountered at index " +
-                                  "{}, timestamp {}".format(i+1, dt_step))
-                break
-            else:
-                self.logger.debug(
-                    "Computed {} for timestamp {}".format(q[i], dt_step))
+        """
 
-        q_series = pd.Series(index=stage_series.index[1:], data=q)
+        if n_jobs == 1:
+            return [self.solve_ts(ts, q0)
+                    for ts, q0 in zip(stage_time_series_list, q0_list)]
 
-        return ComputedDischargeTimeSeries(q_series)
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=n_jobs) as executor:
+            return list(executor.map(
+                self.solve_ts, stage_time_series_list, q0_list))
@@ -1,10 +1,21 @@
 import copy
 
-import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401
+    _HAVE_PYARROW = True
+except ImportError:
+    _HAVE_PYARROW = False
+
+# the shallow-copy design of TimeSeries relies on copy-on-write to
+# isolate the shared buffers; pandas 2.x ships with it off by
+# default, and pandas 3 always enables it (and deprecates setting
+# the option)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
 
 class TimeSeries:
     """Time series class
@@ -15,23 +26,125 @@ class TimeSeries:
 
     """
 
+    # defensive deep copies of the incoming Series; pandas
+    # copy-on-write already protects the internal data from
+    # mutation through outside references, but subclasses can opt
+    # back in
+    _defensive_copy = False
+
+    # the Arrow parser reads date-heavy Aquarius exports faster
+    # than the C engine; set False to force the C engine even when
+    # pyarrow is installed
+    USE_PYARROW = True
+
     def __init__(self, data):
 
-        self._data = data.copy(deep=True)
+        if self._defensive_copy:
+            data = data.copy(deep=True)
+        else:
+            # a shallow copy shares the data buffers; copy-on-write
+            # isolates this series if the caller later assigns into
+            # their own reference
+            data = data.copy(deep=False)
 
-    @staticmethod
-    def _read_aq_csv(csv_path):
+        self._data = data
+
+        # materialize the backing array once; the series is never
+        # mutated after construction, so every hot-path access can
+        # be a plain attribute load regardless of how the pandas
+        # block is stored. copy=False keeps this a view for the
+        # ndarray-backed dtypes this package handles
+        self._values_cache = np.asarray(data.to_numpy(copy=False))
+
+    @classmethod
+    def _read_aq_csv(cls, csv_path):
 
-        df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+        if _HAVE_PYARROW and cls.USE_PYARROW:
+            df = pd.read_csv(csv_path, index_col=0, parse_dates=True,
+                             engine='pyarrow')
+        else:
+            df = pd.read_csv(csv_path, index_col=0, parse_dates=True,
+                             cache_dates=True, dtype={'Value': np.float64})
 
         ts = df['Value']
         ts.index.name = 'DateTime'
 
         return ts
 
+    def _plot_datetimes(self):
+        """Returns matplotlib date numbers for the observation
+        times.
+
+        Computed on first use and reused by every subsequent plot
+        of this instance; converting the index allocates a datetime
+        object per observation.
+        """
+
+        import matplotlib.dates as mdates
+
+        try:
+            return self._plot_datetime_cache
+        except AttributeError:
+            # date2num takes the datetime64 array directly on a
+            # vectorized path; to_pydatetime would allocate a
+            # datetime object per observation first
+            self._plot_datetime_cache = mdates.date2num(
+                self._data.index.values)
+            return self._plot_datetime_cache
+
+    def _na(self):
+        """Returns the boolean mask of null observations.
+
+        Computed on first use; the data never mutates after
+        construction, so null_obs and fill share one pass over the
+        array.
+        """
+
+        try:
+            return self._na_mask
+        except AttributeError:
+            self._na_mask = self._data.isna().to_numpy()
+            return self._na_mask
+
+    def _plot_line(self, label, color, ylabel=None, ax=None):
+        """Draws this series as a labeled line on formatted axes.
+
+        The plot methods share the axes setup and the cached
+        ordinal lookup through this helper, so overlaying several
+        series on one axes formats it once.
+        """
+
+        ax = self._time_series_axes(ax)
+
+        ax.plot(self._plot_datetimes(), self._values_cache,
+                label=label, linestyle='solid', color=color)
+
+        if ylabel is not None:
+            ax.set_ylabel(ylabel)
+
+        ax.legend()
+
+        return ax
+
+    def _plot_markers(self, label, color, ax=None):
+        """Draws this series as labeled markers on formatted axes."""
+
+        ax = self._time_series_axes(ax)
+
+        ax.scatter(self._plot_datetimes(), self._values_cache,
+                   label=label, color=color)
+        ax.legend()
+
+        return ax
+
     @staticmethod
     def _time_series_axes(ax=None):
 
+        # matplotlib is imported on first plot rather than at module
+        # import; parsing-only consumers never pay for it
+        import matplotlib.dates as mdates
+        import matplotlib.pyplot as plt
+
         if ax is None:
             ax = plt.axes()
 
@@ -41,7 +154,22 @@ class TimeSeries:
         return ax
 
     def data(self):
-        """Returns a copy of the data contained in this
+        """Returns the data contained in this time series
+
+        The returned Series shares its buffers with this time
+        series; copy-on-write keeps it safe to assign to without
+        affecting this time series.
+
+        Returns
+        -------
+        pandas.Series
+
+        """
+
+        return self._data.copy(deep=False)
+
+    def data_copy(self):
+        """Returns a deep copy of the data contained in this
         time series
 
         Returns
@@ -50,7 +178,7 @@ class TimeSeries:
 
         """
 
-        return self._data.copy()
+        return self._data.copy(deep=True)
 
     def fill(self, other):
         """Fills values from other time series
@@ -68,19 +196,14 @@ class TimeSeries:
 
         """
 
-        na_observations = self._data.isna()
-        na_idx = self._data.index[na_observations]
-
-        isin_other = other._data.index.isin(na_idx)
-        isin_idx = other._data.index[isin_other]
-
-        fill_idx = na_idx.intersection(isin_idx)
+        # nothing to fill; skip the aligned fill entirely
+        if not self._na().any():
+            return self.__class__(self._data)
 
-        data = self._data.copy()
-
-        data[fill_idx] = other._data[fill_idx]
-
-        return self.__class__(data)
+        # fillna aligns the two series on their indices and fills
+        # in one vectorized pass, replacing the explicit index
+        # intersection and label-based assignment
+        return self.__class__(self._data.fillna(other._data))
 
     @classmethod
     def from_aq_csv(cls, csv_path):
@@ -113,7 +236,9 @@ class TimeSeries:
 
         """
 
-        return self._data.isna().sum()
+        # reduce the cached boolean array; summing the Series
+        # carries an index copy through the dispatch path
+        return int(self._na().sum())
 
     def subset_dt(self, start=None, end=None):
         """Return a subset of this time series based on
@@ -131,21 +256,32 @@ class TimeSeries:
 
         """
 
-        subset_tf = np.full_like(self._data.index, True, bool)
+        index = self._data.index
 
+        start_dt = None
         if start is not None:
             start_dt = pd.to_datetime(start)
             if start_dt.tz is None:
-                start_dt = start_dt.tz_localize(self._data.index.tz)
-            after_start_tf = self._data.index >= start_dt
-            subset_tf = subset_tf & after_start_tf
+                start_dt = start_dt.tz_localize(index.tz)
 
+        end_dt = None
         if end is not None:
             end_dt = pd.to_datetime(end)
             if end_dt.tz is None:
-                end_dt = end_dt.tz_localize(self._data.index.tz)
-            before_end_tf = self._data.index <= end_dt
-            subset_tf = subset_tf & before_end_tf
+                end_dt = end_dt.tz_localize(index.tz)
+
+        if index.is_monotonic_increasing:
+            # a label slice locates the bounds with two binary
+            # searches instead of full boolean passes over the index
+            return self.__class__(self._data.loc[start_dt:end_dt])
+
+        subset_tf = np.full(index.shape, True)
+
+        if start_dt is not None:
+            subset_tf &= index >= start_dt
+
+        if end_dt is not None:
+            subset_tf &= index <= end_dt
 
         return self.__class__(self._data[subset_tf])
 
@@ -166,20 +302,28 @@ class TimeSeries:
         """Returns an array of observed values in this time
         series
 
+        The returned array is a view of this time series' data,
+        not a copy.
+
         Returns
         -------
         numpy.ndarray
 
         """
 
-        return self._data.values
+        return self._values_cache
 
 
 class ObservedDischargeTimeSeries(TimeSeries):
 
     def __init__(self, data, meas_no=None):
 
-        self._meas_no = meas_no
+        # stored as an array once so subsetting slices directly
+        # instead of converting from a list on every call
+        if meas_no is None:
+            self._meas_no = None
+        else:
+            self._meas_no = np.asarray(meas_no)
 
         super().__init__(data)
 
@@ -189,26 +333,24 @@ class ObservedDischargeTimeSeries(TimeSeries):
 
     def plot(self, ax=None):
 
-        ax = self._time_series_axes(ax)
-
-        datetime = mdates.date2num(self._data.index.to_pydatetime())
-
-        ax.scatter(datetime, self._data.values,
-                   label='Observed Discrete Discharge', color='darkorchid')
-        ax.legend()
-
-        return ax
+        return self._plot_markers('Observed Discrete Discharge',
+                                  'darkorchid', ax=ax)
 
     def subset_dt(self, start=None, end=None):
 
         subset = super().subset_dt(start, end)
 
-        subset_dt = self._data.index.isin(subset._data.index)
+        index = self._data.index
+        subset_index = subset._data.index
 
-        self_meas_no = np.asarray(self._meas_no)
-        subset_meas_no = self_meas_no[subset_dt]
-
-        subset._meas_no = list(subset_meas_no)
+        if index.is_monotonic_increasing and len(subset_index):
+            # the subset is a contiguous slice of a sorted index,
+            # so two binary searches bound the measurement numbers
+            lo = index.searchsorted(subset_index[0], side='left')
+            hi = index.searchsorted(subset_index[-1], side='right')
+            subset._meas_no = self._meas_no[lo:hi]
+        else:
+            subset._meas_no = self._meas_no[index.isin(subset_index)]
 
         return subset
 
@@ -217,15 +359,8 @@ class ObservedStageTimeSeries(TimeSeries):
 
     def plot(self, ax=None):
 
-        ax = self._time_series_axes(ax)
-
-        datetime = mdates.date2num(self._data.index.to_pydatetime())
-
-        ax.scatter(datetime, self._data.values,
-                   label='Observed Discrete Stage', color='darkorchid')
-        ax.legend()
-
-        return ax
+        return self._plot_markers('Observed Discrete Stage',
+                                  'darkorchid', ax=ax)
 
 
 class ContinuousTimeSeries(TimeSeries):
@@ -252,28 +387,44 @@ class ContinuousTimeSeries(TimeSeries):
                 "Continuous time series frequency must be specified")
 
         if freq is not None and data.index.freq is None and \
-                data.index.freq != pd.tseries.offsets.DateOffset(seconds=freq):
+                data.index.freq != pd.tseries.frequencies.to_offset(
+                    pd.Timedelta(seconds=freq)):
             data = self._set_freq(data, freq, interp_missing)
-        else:
-            data = data.copy()
 
         super().__init__(data)
 
     @staticmethod
     def _set_freq(data, freq, interp_missing=False):
 
-        freq = '{}S'.format(freq)
+        # build the offset once from the numeric step; string
+        # aliases get re-parsed on every call
+        offset = pd.tseries.frequencies.to_offset(
+            pd.Timedelta(seconds=freq))
         index = pd.date_range(
-            start=data.index[0], end=data.index[-1], freq=freq,
+            start=data.index[0], end=data.index[-1], freq=offset,
             tz=data.index.tz)
         index.name = 'DateTime'
 
-        new_data = pd.Series(index=index, dtype=np.float64)
-        index_intersection = index.intersection(data.index)
-        new_data[index_intersection] = data[index_intersection]
+        # aligned reindex runs on the C path; building an empty
+        # series and label-assigning the intersection walks the
+        # index twice
+        new_data = data.reindex(index)
 
         if interp_missing:
-            new_data = new_data.interpolate()
+            # interpolate the gaps with one np.interp call; the
+            # pandas interpolation dispatcher runs a Python callout
+            # for the same 1-D linear fill. matching Series
+            # semantics, leading gaps stay NaN and trailing gaps
+            # hold the last value
+            values = new_data.to_numpy()
+            valid = np.isfinite(values)
+            if valid.any() and not valid.all():
+                pos = np.arange(values.size)
+                valid_pos = pos[valid]
+                filled = np.interp(pos, valid_pos, values[valid])
+                filled[:valid_pos[0]] = np.nan
+                new_data = pd.Series(filled, index=index,
+                                     name=new_data.name)
 
         return new_data
 
@@ -294,6 +445,17 @@ class ContinuousTimeSeries(TimeSeries):
 
         """
 
+        # coarsening a regular series by an integer factor is a
+        # stride slice — a view of the existing index and values
+        # with no reindex allocation or label hashing
+        index_freq = self._data.index.freq
+        if index_freq is not None and not interp_missing:
+            new_nanos = round(freq*1e9)
+            if new_nanos >= index_freq.nanos and \
+                    new_nanos % index_freq.nanos == 0:
+                return self.__class__(
+                    self._data.iloc[::new_nanos // index_freq.nanos])
+
         data = self._set_freq(self._data, freq, interp_missing)
 
         return self.__class__(data)
@@ -341,18 +503,8 @@ class RatedDischargeTimeSeries(ContinuousTimeSeries):
 
     def plot(self, ax=None):
 
-        ax = self._time_series_axes(ax)
-
-        datetime = mdates.date2num(self._data.index.to_pydatetime())
-
-        ax.plot(datetime, self._data.values,
-                label='USGS Computed Discharge', linestyle='solid',
-                color='darkslategray')
-        ax.set_ylabel('Discharge, in cfs')
-
-        ax.legend()
-
-        return ax
+        return self._plot_line('USGS Computed Discharge', 'darkslategray',
+                               ylabel='Discharge, in cfs', ax=ax)
 
 
 class MeasuredStageTimeSeries(ContinuousTimeSeries):
@@ -387,22 +539,30 @@ class MeasuredStageTimeSeries(ContinuousTimeSeries):
         else:
             raise ValueError("Unrecognized property: {}".format(prop))
 
-        xs_values = np.empty_like(self._data.values)
-
         try:
-            xs_values = xs_method(self._data.values)
+            xs_values = xs_method(self._values_cache)
         except ValueError as e:
 
-            # handle case when xs_method can't handle an array argument
+            # handle case when xs_method can't handle an array
+            # argument; stage series repeat values heavily, so the
+            # property is computed once per unique stage and
+            # scattered back
             if 'Use a.any() or a.all()' in e.args[0]:
-                for i, v in enumerate(self._data.values):
-                    xs_values[i] = xs_method(v)
+                values = self._values_cache
+                finite = np.isfinite(values)
+                unique, inverse = np.unique(values[finite],
+                                            return_inverse=True)
+                computed = np.fromiter(
+                    (xs_method(v) for v in unique),
+                    dtype=np.float64, count=len(unique))
+                xs_values = np.full(values.shape, np.nan)
+                xs_values[finite] = computed[inverse]
             else:
                 raise e
 
         ax = self._time_series_axes(ax)
 
-        datetime = mdates.date2num(self._data.index.to_pydatetime())
+        datetime = self._plot_datetimes()
 
         ax.plot(datetime, xs_values, label=label)
         ax.legend()
@@ -411,20 +571,42 @@ class MeasuredStageTimeSeries(ContinuousTimeSeries):
 
     def plot(self, ax=None):
 
-        ax = self._time_series_axes(ax)
+        return self._plot_line('Measured Stage', 'darkslategray',
+                               ylabel='Stage, in ft', ax=ax)
 
-        datetime = mdates.date2num(self._data.index.to_pydatetime())
 
-        ax.plot(datetime, self._data.values, label='Measured Stage',
-                linestyle='solid', color='darkslategray')
-        ax.set_ylabel('Stage, in ft')
+class ComputedDischargeTimeSeries(ContinuousTimeSeries):
 
-        ax.legend()
+    def _aligned(self, rated_discharge):
+        """Returns the measured and computed series aligned on
+        their common timestamps.
 
-        return ax
+        The error metrics all need the same alignment, so it's
+        computed with a single inner join, unwrapped to plain
+        arrays, and cached for the most recent rated series. The
+        cache entry holds the rated series itself; an id-based key
+        alone could silently match a new object allocated at a
+        dead object's address.
+        """
 
+        try:
+            cached_rated, aligned = self._aligned_cache
+        except AttributeError:
+            pass
+        else:
+            if cached_rated is rated_discharge:
+                return aligned
 
-class ComputedDischargeTimeSeries(ContinuousTimeSeries):
+        joined = pd.concat([rated_discharge.data().rename('meas'),
+                            self._data.rename('comp')],
+                           axis=1, join='inner')
+
+        aligned = (joined.index,
+                   joined['meas'].to_numpy(),
+                   joined['comp'].to_numpy())
+        self._aligned_cache = (rated_discharge, aligned)
+
+        return aligned
 
     def mean_error(self, rated_discharge, relative=False):
         """Returns the mean error of the intersection of time
@@ -443,17 +625,16 @@ class ComputedDischargeTimeSeries(ContinuousTimeSeries):
 
         """
 
-        q_rated = rated_discharge.data()
-
-        intersect_idx = self._data.index.intersection(q_rated.index)
-
-        q_meas = q_rated[intersect_idx]
-        q_comp = self._data[intersect_idx]
+        _, q_meas, q_comp = self._aligned(rated_discharge)
 
         error = q_comp - q_meas
 
         if relative:
-            error = 100 * error / q_meas
+            # zero measured discharges map to NaN instead of
+            # tripping a divide warning and leaving inf
+            rel = np.full_like(error, np.nan)
+            np.divide(100*error, q_meas, out=rel, where=q_meas != 0)
+            error = rel
 
         mean_error = np.mean(error)
 
@@ -461,17 +642,8 @@ class ComputedDischargeTimeSeries(ContinuousTimeSeries):
 
     def plot(self, ax=None):
 
-        ax = self._time_series_axes(ax)
-
-        datetime = mdates.date2num(self._data.index.to_pydatetime())
-
-        ax.plot(datetime, self._data.values, label='DYNRAT Computed Discharge',
-                linestyle='solid', color='dodgerblue')
-        ax.set_ylabel('Discharge, in csf')
-
-        ax.legend()
-
-        return ax
+        return self._plot_line('DYNRAT Computed Discharge', 'dodgerblue',
+                               ylabel='Discharge, in csf', ax=ax)
 
     def plot_relative_error(self, rated_discharge, ax=None):
         """Plots relative error time series
@@ -487,6 +659,8 @@ class ComputedDischargeTimeSeries(ContinuousTimeSeries):
 
         """
 
+        import matplotlib.dates as mdates
+
         ax = self._time_series_axes(ax)
 
         relative_error = self.relative_error(rated_discharge)
@@ -514,25 +688,20 @@ class ComputedDischargeTimeSeries(ContinuousTimeSeries):
 
         """
 
-        q_rated = rated_discharge.data()
-
-        intersect_idx = self._data.index.intersection(q_rated.index)
+        index, q_meas, q_comp = self._aligned(rated_discharge)
 
-        q_meas = q_rated[intersect_idx]
-        q_comp = self._data[intersect_idx]
+        # arithmetic on the raw arrays; a Series is built only for
+        # the return value. zero measured discharges map to NaN
+        # instead of tripping a divide warning and leaving inf
+        num = 100*(q_comp - q_meas)
+        error = np.full_like(num, np.nan)
+        np.divide(num, q_meas, out=error, where=q_meas != 0)
 
-        relative_error = 100*(q_comp - q_meas)/q_meas
-
-        return pd.Series(index=intersect_idx, data=relative_error)
+        return pd.Series(error, index=index)
 
     def rmse(self, rated_discharge):
 
-        q_rated = rated_discharge.data()
-
-        intersect_idx = self._data.index.intersection(q_rated.index)
-
-        q_meas = q_rated[intersect_idx]
-        q_comp = self._data[intersect_idx]
+        _, q_meas, q_comp = self._aligned(rated_discharge)
 
         sq_error = (q_comp - q_meas)**2
         rmse = np.sqrt(np.mean(sq_error))
@@ -544,17 +713,8 @@ class ComputedStageTimeSeries(ContinuousTimeSeries):
 
     def plot(self, ax=None):
 
-        ax = self._time_series_axes(ax)
-
-        datetime = mdates.date2num(self._data.index.to_pydatetime())
-
-        ax.plot(datetime, self._data.values, label='DYNRAT Computed Stage',
-                linestyle='solid', color='dodgerblue')
-        ax.set_ylabel('Stage, in ft')
-
-        ax.legend()
-
-        return ax
+        return self._plot_line('DYNRAT Computed Stage', 'dodgerblue',
+                               ylabel='Stage, in ft', ax=ax)
 
     def plot_relative_error(self, measured_stage, ax=None):
         """Plots relative error time series
@@ -570,6 +730,8 @@ class ComputedStageTimeSeries(ContinuousTimeSeries):
 
         """
 
+        import matplotlib.dates as mdates
+
         ax = self._time_series_axes(ax)
 
         relative_error = self.relative_error(measured_stage)
@@ -627,67 +789,40 @@ def parse_nwis_csv(csv_path):
 
     """
 
-    with open(csv_path) as f:
-        lines = f.readlines()
-
-    header = lines[0].strip().replace('"', '').split(',')
-
-    dt_column = header.index('dateTime')
-    tz_column = header.index('tz_cd')
-
-    try:
-        q_column = header.index('X_00060_00000')
-        read_q = True
-    except ValueError:
-        read_q = False
-
-    try:
-        h_column = header.index('X_00065_00000')
-        read_h = True
-    except ValueError:
-        read_h = False
+    # the C tokenizer parses the whole file in one pass; the
+    # per-row Python loop it replaces dominated on large files.
+    # only tokenize the columns that are read — dataRetrieval
+    # exports carry several unused qualifier columns
+    columns = {'dateTime', 'tz_cd', 'X_00065_00000', 'X_00060_00000'}
+    df = pd.read_csv(csv_path, usecols=lambda c: c in columns)
 
-    dt_data = []
-    h_data = []
-    q_data = []
+    datetimes = pd.to_datetime(df['dateTime'])
 
-    for line in lines[1:]:
+    # localize each time zone group vectorized instead of one
+    # timestamp at a time
+    utc = pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns, UTC]')
 
-        line_data = line.strip().split(',')
+    for tz, group in df.groupby('tz_cd'):
+        utc[group.index] = datetimes[group.index].dt.tz_localize(
+            tz).dt.tz_convert('UTC')
 
-        line_data = [col.replace('"', '') for col in line_data]
-
-        datetime = pd.to_datetime(line_data[dt_column])
-        tz = line_data[tz_column].strip('"')
-        datetime = datetime.tz_localize(tz)
-        datetime = datetime.tz_convert('UTC')
-        dt_data.append(datetime)
-
-        if read_h:
-            try:
-                stage = float(line_data[h_column])
-            except ValueError:
-                stage = np.nan
-        else:
-            stage = np.nan
-        h_data.append(stage)
-
-        if read_q:
-            try:
-                discharge = float(line_data[q_column])
-            except ValueError:
-                discharge = np.nan
-        else:
-            discharge = np.nan
-        q_data.append(discharge)
-
-    index = pd.DatetimeIndex(dt_data)
+    index = pd.DatetimeIndex(utc)
     index.name = 'DateTime'
 
-    data = np.stack([h_data, q_data], axis=1)
-    columns = ['Stage', 'Discharge']
+    if 'X_00065_00000' in df.columns:
+        h_data = pd.to_numeric(
+            df['X_00065_00000'], errors='coerce').to_numpy(np.float64)
+    else:
+        h_data = np.full(len(df), np.nan)
 
-    return pd.DataFrame(data=data, index=index, columns=columns)
+    if 'X_00060_00000' in df.columns:
+        q_data = pd.to_numeric(
+            df['X_00060_00000'], errors='coerce').to_numpy(np.float64)
+    else:
+        q_data = np.full(len(df), np.nan)
+
+    return pd.DataFrame(data={'Stage': h_data, 'Discharge': q_data},
+                        index=index)
 
 
 def read_nwis_rdb(rdb_path):
@@ -716,58 +851,59 @@ def read_nwis_rdb(rdb_path):
                   'PDT': 'PST8PDT',
                   '': 'UTC'}
 
+    # only scan for the header position; the C tokenizer parses
+    # the rest of the file in one pass
     with open(rdb_path) as f:
-        lines = f.readlines()
-
-    i = 0
-    while lines[i][0] == '#':
-        i += 1
-
-    header_line = i
-    header = lines[i].strip().split('\t')
-
-    dt_column = header.index('measurement_dt')  # date and time
-    meas_num_column = header.index('measurement_nu')  # measurement number
-    tz_column = header.index('tz_cd')  # time zone
-    h_column = header.index('gage_height_va')  # stage
-    q_column = header.index('discharge_va')  # discharge
-
-    dt_data = []
-    meas_num_data = []
-    h_data = []
-    q_data = []
-
-    for line in lines[header_line+2:]:
-
-        line_data = line.strip().split('\t')
+        header_line = 0
+        for line in f:
+            if line[0] != '#':
+                break
+            header_line += 1
+
+    # only tokenize the columns that are read; RDB measurement
+    # files carry dozens of unused fields
+    columns = {'measurement_dt', 'tz_cd', 'gage_height_va',
+               'discharge_va', 'measurement_nu'}
+    df = pd.read_csv(rdb_path, sep='\t', skiprows=header_line, dtype=str,
+                     usecols=lambda c: c in columns)
+
+    # the row after the header holds the column format codes
+    df = df.iloc[1:]
+
+    # RDB measurement timestamps use one fixed format; parsing with
+    # it skips per-value format inference. files that deviate (or
+    # carry unparseable rows) take the inferring path, which coerces
+    # bad rows to NaT as before
+    try:
+        datetimes = pd.to_datetime(df['measurement_dt'],
+                                   format='%Y-%m-%d %H:%M')
+    except ValueError:
+        datetimes = pd.to_datetime(df['measurement_dt'], errors='coerce')
 
-        try:
-            datetime = pd.to_datetime(line_data[dt_column])
-        except IndexError:
-            continue
+    # rows without a parseable measurement datetime are skipped,
+    # as the per-row parser did for short rows
+    valid = datetimes.notna()
+    df = df[valid]
+    datetimes = datetimes[valid]
 
-        try:
-            stage = float(line_data[h_column])
-        except (IndexError, ValueError):
-            stage = np.nan
+    h_data = pd.to_numeric(
+        df['gage_height_va'], errors='coerce').to_numpy(np.float64)
+    q_data = pd.to_numeric(
+        df['discharge_va'], errors='coerce').to_numpy(np.float64)
 
-        try:
-            discharge = float(line_data[q_column])
-        except (IndexError, ValueError):
-            discharge = np.nan
+    meas_num_data = df['measurement_nu'].to_numpy()
 
-        tz = line_data[tz_column]
-        datetime = datetime.tz_localize(time_zones[tz])
-        datetime = datetime.tz_convert('UTC')
+    # localize each time zone group vectorized instead of one
+    # timestamp at a time
+    tz = df['tz_cd'].fillna('').map(time_zones)
 
-        meas_num = line_data[meas_num_column]
+    utc = pd.Series(pd.NaT, index=df.index, dtype='datetime64[ns, UTC]')
 
-        h_data.append(stage)
-        q_data.append(discharge)
-        dt_data.append(datetime)
-        meas_num_data.append(meas_num)
+    for tz_name, group in df.groupby(tz):
+        utc[group.index] = datetimes[group.index].dt.tz_localize(
+            tz_name).dt.tz_convert('UTC')
 
-    index = pd.DatetimeIndex(dt_data)
+    index = pd.DatetimeIndex(utc)
 
     stage_series = ObservedStageTimeSeries(pd.Series(index=index, data=h_data))
     discharge_series = ObservedDischargeTimeSeries(
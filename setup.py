@@ -16,11 +16,15 @@ version = about['__version__']
 
 dev_status = 'Development Status :: 3 - Alpha'
 
-install_requires = ['numpy==1.22.1',
-                    'pandas==1.4.0',
-                    'scipy==1.7.3',
-                    'tables==3.7.0',
-                    'PyYAML==6.0']
+install_requires = ['numpy>=1.24,<3',
+                    'pandas>=2.1,<3',
+                    'scipy>=1.11',
+                    'tables>=3.7',
+                    'PyYAML>=6.0']
+
+# the solvers fall back to interpreted kernels without numba; the
+# extra installs the compiled fast path
+extras_require = {'speedups': ['numba>=0.57']}
 
 setup_kwargs = {
     'name': name,
@@ -38,7 +42,8 @@ setup_kwargs = {
         'Topic :: Scientific/Engineering :: Hydrology'
     ],
     'python_requires': '~=3.10',
-    'install_requires': install_requires
+    'install_requires': install_requires,
+    'extras_require': extras_require
 }
 
 if sphinx_imported:
@@ -0,0 +1,49 @@
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from dynrat.dynmod import QSolver
+from dynrat.frict import TableFrict
+
+
+class RectSect:
+    """Rectangular channel section with analytic properties"""
+
+    def __init__(self, width):
+        self._width = width
+
+    def area(self, stage):
+        return self._width * stage
+
+    def top_width(self, stage):
+        return self._width + 0 * stage
+
+    def wetted_perimeter(self, stage):
+        return self._width + 2 * stage
+
+
+class TestQSolver(TestCase):
+
+    def test_zero_func_array(self):
+
+        sect = RectSect(100.)
+        frict = TableFrict([0., 50.], [0.035, 0.035])
+        solver = QSolver(sect, frict, 0.0005, 20., 900.)
+
+        h = np.array([10., 10.5, 10.4, 11.])
+        h_prime = np.array([9.9, 10., 10.5, 10.4])
+        q = np.array([4000., 4500., 4400., 5000.])
+        q_prime = np.array([3900., 4000., 4500., 4400.])
+
+        scalar = np.array([
+            solver.zero_func(h[i], h_prime[i], q[i], q_prime[i])
+            for i in range(h.size)])
+        array = solver.zero_func(h, h_prime, q, q_prime)
+
+        self.assertIsInstance(array, np.ndarray)
+        self.assertTrue(np.array_equal(scalar, array))
+
+
+if __name__ == '__main__':
+    unittest.main()
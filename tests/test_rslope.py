@@ -1,5 +1,6 @@
 import os
 import unittest
+from functools import lru_cache
 from unittest import TestCase
 
 import numpy as np
@@ -13,6 +14,18 @@ current_path = os.path.dirname(os.path.realpath(__file__))
 examples_dir = os.path.relpath(os.path.join(current_path, '..', 'examples'))
 
 
+@lru_cache(maxsize=None)
+def _load_xs_coordinates(xs_data_path):
+    """Parses the cross section coordinate file once per session."""
+
+    import pandas as pd
+
+    coordinates = pd.read_csv(
+        xs_data_path, header=0, dtype=np.float64).to_numpy()
+
+    return coordinates[:, 0], coordinates[:, 1]
+
+
 class TestRSlope(TestCase):
 
     def test_r_slope(self):
@@ -20,8 +33,7 @@ class TestRSlope(TestCase):
         xs_data_path = os.path.join(examples_dir, 'data', 'stlms', 'xs.csv')
 
         roughness = 0.035
-        station, elevation = np.loadtxt(
-            xs_data_path, delimiter=',', skiprows=1, unpack=True)
+        station, elevation = _load_xs_coordinates(xs_data_path)
         datum = 379.58
         elevation = elevation - datum
         sect = CrossSection(station, elevation, roughness)